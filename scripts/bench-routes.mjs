@@ -0,0 +1,419 @@
+#!/usr/bin/env node
+// 路由性能基准：构建并启动生产服务，记录构建耗时、首屏 JS 体积、TTFB、吞吐量和延迟分位数，
+// 结果写入 bench/report.json，并与 bench/baseline.json 比较，出现性能回退或缺少基线时以非零状态退出。
+//
+// 耗时类指标依赖机器，基线不提交到仓库，由 CI 在同一台机器上先对基准 commit 生成（见 README）。
+//
+// 用法：
+//   npm run bench                          # 冷构建 + 压测 + 与基线比较
+//   npm run bench:baseline                 # 冷构建 + 压测，结果写为基线
+//   npm run bench -- --skip-build          # 复用已有的 .next 构建产物
+//   npm run bench -- --update-baseline     # 用本次结果生成或覆盖基线
+//   npm run bench:bundle                   # 只构建并输出各路由首屏 JS 体积报告
+//   npm run bench -- --duration=10 --concurrency=32 --port=3100
+
+import { spawn } from 'node:child_process'
+import { existsSync, promises as fs, readFileSync } from 'node:fs'
+import http from 'node:http'
+import path from 'node:path'
+import { performance } from 'node:perf_hooks'
+import { fileURLToPath } from 'node:url'
+import { gzipSync } from 'node:zlib'
+
+const ROOT = path.resolve(path.dirname(fileURLToPath(import.meta.url)), '..')
+const NEXT_DIR = path.join(ROOT, '.next')
+const REPORT_FILE = path.join(ROOT, 'bench', 'report.json')
+const BASELINE_FILE = path.join(ROOT, 'bench', 'baseline.json')
+
+// 被测路由；trailingSlash 开启，页面路径带斜杠以避免 308 重定向
+const ROUTES = [
+  { name: '/', path: '/', page: '/page' },
+  { name: '/components', path: '/components/', page: '/components/page' },
+  { name: '/seo-demo', path: '/seo-demo/', page: '/seo-demo/page' },
+  { name: '/isr-demo', path: '/isr-demo/', page: '/isr-demo/page' },
+  { name: '/sitemap.xml', path: '/sitemap.xml' },
+  { name: '/robots.txt', path: '/robots.txt' },
+]
+
+// 允许的回退幅度（相对基线）
+const THRESHOLDS = {
+  buildTimeMs: 0.25,
+  firstLoadJsBytes: 0.05,
+  ttfbMs: 0.25,
+  requestsPerSecond: 0.15,
+  p50Ms: 0.25,
+  p99Ms: 0.3,
+}
+
+// 数值越大越好的指标
+const HIGHER_IS_BETTER = new Set(['requestsPerSecond'])
+
+function parseArgs(argv) {
+  const options = {
+    skipBuild: false,
+    updateBaseline: false,
+    bundleOnly: false,
+    duration: 10,
+    concurrency: 16,
+    port: 3100,
+  }
+
+  for (const arg of argv) {
+    const [key, value] = arg.replace(/^--/, '').split('=')
+    switch (key) {
+      case 'skip-build':
+        options.skipBuild = true
+        break
+      case 'update-baseline':
+        options.updateBaseline = true
+        break
+      case 'bundle-only':
+        options.bundleOnly = true
+        break
+      case 'duration':
+      case 'concurrency':
+      case 'port':
+        options[key] = Number(value)
+        if (!Number.isFinite(options[key]) || options[key] <= 0) {
+          throw new Error(`--${key} must be a positive number`)
+        }
+        break
+      default:
+        throw new Error(`Unknown option: ${arg}`)
+    }
+  }
+
+  return options
+}
+
+function run(command, args, env = {}) {
+  return new Promise((resolve, reject) => {
+    const child = spawn(command, args, {
+      cwd: ROOT,
+      stdio: 'inherit',
+      env: { ...process.env, NEXT_TELEMETRY_DISABLED: '1', ...env },
+    })
+    child.on('error', reject)
+    child.on('exit', code =>
+      code === 0
+        ? resolve()
+        : reject(new Error(`${command} ${args.join(' ')} exited ${code}`))
+    )
+  })
+}
+
+async function coldBuild() {
+  await fs.rm(NEXT_DIR, { recursive: true, force: true })
+  const start = performance.now()
+  await run('npm', ['run', 'build'])
+  return Math.round(performance.now() - start)
+}
+
+async function readJson(file) {
+  return JSON.parse(await fs.readFile(file, 'utf8'))
+}
+
+// 首屏 JS：根布局 + 页面所需 chunk 的 gzip 体积之和（与 next build 输出的 First Load JS 口径一致）
+async function measureFirstLoadJs() {
+  const appManifest = await readJson(
+    path.join(NEXT_DIR, 'app-build-manifest.json')
+  )
+  const buildManifest = await readJson(
+    path.join(NEXT_DIR, 'build-manifest.json')
+  )
+  const gzipSizes = new Map()
+
+  async function gzipSize(file) {
+    if (!gzipSizes.has(file)) {
+      const content = await fs.readFile(path.join(NEXT_DIR, file))
+      gzipSizes.set(file, gzipSync(content, { level: 9 }).length)
+    }
+    return gzipSizes.get(file)
+  }
+
+  const sizes = {}
+  for (const route of ROUTES) {
+    if (!route.page) {
+      continue
+    }
+
+    const files = new Set([
+      ...(buildManifest.rootMainFiles || []),
+      ...(appManifest.pages['/layout'] || []),
+      ...(appManifest.pages[route.page] || []),
+    ])
+    let total = 0
+    for (const file of files) {
+      if (file.endsWith('.js')) {
+        total += await gzipSize(file)
+      }
+    }
+    sizes[route.name] = total
+  }
+  return sizes
+}
+
+async function waitForServer(port, timeoutMs = 30000) {
+  const deadline = Date.now() + timeoutMs
+  while (Date.now() < deadline) {
+    try {
+      await request({ port, path: '/robots.txt', agent: false })
+      return
+    } catch {
+      await new Promise(resolve => setTimeout(resolve, 200))
+    }
+  }
+  throw new Error(`Server did not start on port ${port}`)
+}
+
+function request({ port, path: requestPath, agent }) {
+  return new Promise((resolve, reject) => {
+    const start = performance.now()
+    let ttfb = 0
+    const req = http.get(
+      { host: '127.0.0.1', port, path: requestPath, agent },
+      res => {
+        res.once('data', () => {
+          ttfb = performance.now() - start
+        })
+        res.on('end', () => {
+          if (res.statusCode !== 200) {
+            reject(new Error(`GET ${requestPath} returned ${res.statusCode}`))
+            return
+          }
+          const total = performance.now() - start
+          resolve({ ttfb: ttfb || total, total })
+        })
+        res.resume()
+      }
+    )
+    req.on('error', reject)
+  })
+}
+
+function percentile(sorted, p) {
+  if (sorted.length === 0) {
+    return 0
+  }
+  const index = Math.ceil((p / 100) * sorted.length) - 1
+  return sorted[Math.min(sorted.length - 1, Math.max(0, index))]
+}
+
+function round(value) {
+  return Math.round(value * 100) / 100
+}
+
+// TTFB：新建连接的顺序请求取中位数
+async function measureTtfb(port, requestPath, samples = 20) {
+  const values = []
+  for (let i = 0; i < samples; i++) {
+    const { ttfb } = await request({ port, path: requestPath, agent: false })
+    values.push(ttfb)
+  }
+  values.sort((a, b) => a - b)
+  return round(percentile(values, 50))
+}
+
+// 固定并发的 keep-alive 压测
+async function loadTest(port, requestPath, { duration, concurrency }) {
+  const agent = new http.Agent({ keepAlive: true, maxSockets: concurrency })
+  const latencies = []
+  let errors = 0
+
+  // 预热，避免首次请求的按需渲染计入结果
+  await request({ port, path: requestPath, agent })
+
+  const start = performance.now()
+  const deadline = start + duration * 1000
+
+  async function worker() {
+    while (performance.now() < deadline) {
+      try {
+        const { total } = await request({ port, path: requestPath, agent })
+        latencies.push(total)
+      } catch {
+        errors++
+      }
+    }
+  }
+
+  await Promise.all(Array.from({ length: concurrency }, worker))
+  const elapsed = (performance.now() - start) / 1000
+  agent.destroy()
+
+  latencies.sort((a, b) => a - b)
+  return {
+    requests: latencies.length,
+    errors,
+    requestsPerSecond: round(latencies.length / elapsed),
+    p50Ms: round(percentile(latencies, 50)),
+    p99Ms: round(percentile(latencies, 99)),
+  }
+}
+
+async function benchmarkServer(options) {
+  const server = spawn('npx', ['next', 'start', '-p', String(options.port)], {
+    cwd: ROOT,
+    stdio: ['ignore', 'ignore', 'inherit'],
+    env: { ...process.env, NEXT_TELEMETRY_DISABLED: '1' },
+    detached: true,
+  })
+
+  try {
+    await waitForServer(options.port)
+
+    const results = {}
+    for (const route of ROUTES) {
+      console.log(`Benchmarking ${route.name} ...`)
+      const ttfbMs = await measureTtfb(options.port, route.path)
+      const load = await loadTest(options.port, route.path, options)
+      results[route.name] = { ttfbMs, ...load }
+    }
+    return results
+  } finally {
+    // 结束整个进程组（npx 会派生 next 子进程）
+    try {
+      process.kill(-server.pid, 'SIGTERM')
+    } catch {
+      server.kill('SIGTERM')
+    }
+  }
+}
+
+function compareWithBaseline(report, baseline) {
+  const regressions = []
+
+  function check(label, metric, current, previous) {
+    if (typeof current !== 'number' || typeof previous !== 'number') {
+      return
+    }
+    if (previous === 0) {
+      return
+    }
+
+    const change = (current - previous) / previous
+    const regressed = HIGHER_IS_BETTER.has(metric)
+      ? change < -THRESHOLDS[metric]
+      : change > THRESHOLDS[metric]
+    if (regressed) {
+      const percent = (change * 100).toFixed(1)
+      regressions.push(
+        `${label} ${metric}: ${previous} -> ${current} (${percent}%)`
+      )
+    }
+  }
+
+  check('build', 'buildTimeMs', report.buildTimeMs, baseline.buildTimeMs)
+  for (const route of ROUTES) {
+    const current = report.routes[route.name] || {}
+    const previous = baseline.routes?.[route.name] || {}
+    for (const metric of Object.keys(THRESHOLDS)) {
+      if (metric !== 'buildTimeMs') {
+        check(route.name, metric, current[metric], previous[metric])
+      }
+    }
+  }
+
+  return regressions
+}
+
+// 首屏 JS 体积报告，存在基线时同时列出变化量
+function printBundleReport(firstLoadJs) {
+  const baseline = existsSync(BASELINE_FILE)
+    ? JSON.parse(readFileSync(BASELINE_FILE, 'utf8'))
+    : null
+
+  const rows = {}
+  for (const [route, bytes] of Object.entries(firstLoadJs)) {
+    const previous = baseline?.routes?.[route]?.firstLoadJsBytes
+    rows[route] = {
+      'First Load JS (kB)': round(bytes / 1024),
+      'Baseline (kB)':
+        typeof previous === 'number' ? round(previous / 1024) : '-',
+      'Change (kB)':
+        typeof previous === 'number' ? round((bytes - previous) / 1024) : '-',
+    }
+  }
+  console.table(rows)
+}
+
+async function main() {
+  const options = parseArgs(process.argv.slice(2))
+
+  // 没有基线时无法判断是否回退，直接失败而不是静默生成新基线，避免 CI 中的回退被放过
+  if (
+    !options.bundleOnly &&
+    !options.updateBaseline &&
+    !existsSync(BASELINE_FILE)
+  ) {
+    console.error(
+      `No baseline found at ${path.relative(ROOT, BASELINE_FILE)}, ` +
+        'run npm run bench:baseline on the base commit first ' +
+        '(see "Performance benchmarks" in README.md).'
+    )
+    process.exit(1)
+  }
+
+  let buildTimeMs = null
+  if (options.skipBuild) {
+    if (!existsSync(path.join(NEXT_DIR, 'BUILD_ID'))) {
+      throw new Error('No production build found, run without --skip-build')
+    }
+  } else {
+    buildTimeMs = await coldBuild()
+  }
+
+  const firstLoadJs = await measureFirstLoadJs()
+  if (options.bundleOnly) {
+    printBundleReport(firstLoadJs)
+    return
+  }
+
+  const serverResults = await benchmarkServer(options)
+
+  const routes = {}
+  for (const route of ROUTES) {
+    routes[route.name] = {
+      firstLoadJsBytes: firstLoadJs[route.name] ?? null,
+      ...serverResults[route.name],
+    }
+  }
+
+  const report = {
+    generatedAt: new Date().toISOString(),
+    node: process.version,
+    options: { duration: options.duration, concurrency: options.concurrency },
+    buildTimeMs,
+    routes,
+  }
+
+  await fs.mkdir(path.dirname(REPORT_FILE), { recursive: true })
+  await fs.writeFile(REPORT_FILE, `${JSON.stringify(report, null, 2)}\n`)
+  console.table(routes)
+  if (buildTimeMs !== null) {
+    console.log(`Cold build: ${buildTimeMs} ms`)
+  }
+  console.log(`Report written to ${path.relative(ROOT, REPORT_FILE)}`)
+
+  if (options.updateBaseline) {
+    await fs.writeFile(BASELINE_FILE, `${JSON.stringify(report, null, 2)}\n`)
+    console.log(`Baseline written to ${path.relative(ROOT, BASELINE_FILE)}`)
+    return
+  }
+
+  const baseline = await readJson(BASELINE_FILE)
+  const regressions = compareWithBaseline(report, baseline)
+  if (regressions.length > 0) {
+    console.error('Performance regressions against baseline:')
+    for (const regression of regressions) {
+      console.error(`  - ${regression}`)
+    }
+    process.exit(1)
+  }
+  console.log('No regressions against baseline.')
+}
+
+main().catch(error => {
+  console.error(error)
+  process.exit(1)
+})
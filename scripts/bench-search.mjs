@@ -0,0 +1,121 @@
+#!/usr/bin/env node
+// 搜索索引基准：生成合成的中英文混合文章，构建并序列化索引，测量加载耗时和查询延迟。
+//
+// 用法：npm run bench:search
+//       BENCH_DOCS=200000 npm run bench:search
+
+import { performance } from 'node:perf_hooks'
+import {
+  SearchIndex,
+  buildSearchIndex,
+  serializeSearchIndex,
+} from '../src/lib/search/core.mjs'
+
+const DOC_COUNT = Number(process.env.BENCH_DOCS || 100000)
+const QUERY_ROUNDS = Number(process.env.BENCH_ROUNDS || 50)
+
+const WORDS = [
+  '前端', '开发', '性能', '优化', '缓存', '渲染', '组件', '服务端', '静态',
+  '生成', '增量', '索引', '搜索', '部署', '测试', '类型', '安全', '数据库',
+  '架构', '工程化', '构建', '打包', '路由', '中间件', '状态', '管理', '动画',
+  'React', 'Next.js', 'TypeScript', 'Tailwind', 'Vercel', 'Node.js', 'SEO',
+  'ISR', 'SSR', 'Webpack', 'Turbopack', 'GraphQL', 'Redis', 'Docker',
+]
+const CATEGORIES = ['前端开发', '后端开发', 'AI工具', '运维部署', '技术分享']
+
+// 固定种子的伪随机数，保证每次生成的数据一致
+let seed = 42
+function random() {
+  seed = (seed * 1664525 + 1013904223) % 4294967296
+  return seed / 4294967296
+}
+
+function pick(list) {
+  return list[Math.floor(random() * list.length)]
+}
+
+function sentence(length) {
+  return Array.from({ length }, () => pick(WORDS)).join('')
+}
+
+function* generateDocuments(count) {
+  for (let i = 0; i < count; i++) {
+    yield {
+      slug: `post-${i}`,
+      title: `${sentence(4)} ${i}`,
+      description: sentence(16),
+      keywords: Array.from({ length: 3 }, () => pick(WORDS)),
+      category: pick(CATEGORIES),
+    }
+  }
+}
+
+const QUERIES = [
+  '性能优化',
+  '前端开发',
+  '缓存',
+  '服务端渲染',
+  'react',
+  'next',
+  'type',
+  'Redis 缓存',
+  '增量静态生成',
+  'docker 部署',
+  '搜',
+  'tailwind 组件',
+]
+
+function percentile(sorted, p) {
+  const index = Math.ceil((p / 100) * sorted.length) - 1
+  return sorted[Math.min(sorted.length - 1, Math.max(0, index))]
+}
+
+function main() {
+  let start = performance.now()
+  const serialized = serializeSearchIndex(
+    buildSearchIndex(generateDocuments(DOC_COUNT))
+  )
+  const buildMs = performance.now() - start
+
+  start = performance.now()
+  const index = SearchIndex.deserialize(serialized)
+  const loadMs = performance.now() - start
+
+  // 预热
+  for (const query of QUERIES) {
+    index.search(query, 10)
+  }
+
+  const rows = {}
+  const all = []
+  for (const query of QUERIES) {
+    const latencies = []
+    let hits = 0
+    for (let i = 0; i < QUERY_ROUNDS; i++) {
+      const queryStart = performance.now()
+      hits = index.search(query, 10).length
+      latencies.push(performance.now() - queryStart)
+    }
+    latencies.sort((a, b) => a - b)
+    all.push(...latencies)
+    rows[query] = {
+      hits,
+      'p50 (ms)': Number(percentile(latencies, 50).toFixed(3)),
+      'p99 (ms)': Number(percentile(latencies, 99).toFixed(3)),
+    }
+  }
+  all.sort((a, b) => a - b)
+
+  console.log(
+    `Search benchmark: ${DOC_COUNT} documents, ${index.terms.length} terms`
+  )
+  console.log(`  build: ${buildMs.toFixed(0)} ms`)
+  console.log(`  load:  ${loadMs.toFixed(0)} ms`)
+  console.log(`  size:  ${(serialized.length / 1024 / 1024).toFixed(1)} MB`)
+  console.table(rows)
+  console.log(
+    `  overall p50 ${percentile(all, 50).toFixed(3)} ms, p99 ${percentile(all, 99).toFixed(3)} ms`
+  )
+}
+
+main()
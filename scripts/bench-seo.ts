@@ -0,0 +1,208 @@
+// SEO metadata 生成微基准：对比旧的逐次合并实现与预编译 + LRU 实现
+//
+// 用法：npm run bench:seo
+// 生产模式（紧凑 JSON-LD）：NODE_ENV=production npm run bench:seo
+
+import { performance } from 'node:perf_hooks'
+import seoConfig from '../src/config/seo.json'
+import {
+  type BlogArticleData,
+  type SEOConfig,
+  generateBlogSEOMetadata,
+  generateStructuredData,
+} from '../src/lib/seo'
+
+const ITERATIONS = Number(process.env.BENCH_ITERATIONS || 100000)
+// 模拟 ISR 重新生成时反复渲染的文章数量（小于 LRU 容量，全部命中缓存）
+const ARTICLE_COUNT = Number(process.env.BENCH_ARTICLES || 200)
+// 冷路径的文章数量：大于 src/lib/seo.ts 中的 ARTICLE_CACHE_SIZE（500），
+// 按顺序循环访问时 LRU 每次都未命中，衡量首次渲染 / 大量文章轮换时的开销
+const MISS_ARTICLE_COUNT = Number(process.env.BENCH_MISS_ARTICLES || 5000)
+
+const pretty = process.env.NODE_ENV !== 'production'
+
+// ---- 旧实现（优化前的 src/lib/seo.ts） ----
+
+function legacyGenerateSEOMetadata(config: SEOConfig = {}) {
+  const defaults = seoConfig.defaults
+
+  const mergedConfig = {
+    ...defaults,
+    ...config,
+    openGraph: {
+      ...defaults.openGraph,
+      ...config.openGraph,
+    },
+    twitter: {
+      ...defaults.twitter,
+      ...config.twitter,
+    },
+  }
+
+  return {
+    title: mergedConfig.title,
+    description: mergedConfig.description,
+    keywords: mergedConfig.keywords,
+    authors: mergedConfig.author ? [{ name: mergedConfig.author }] : undefined,
+    alternates: {
+      canonical: mergedConfig.canonicalUrl,
+    },
+    openGraph: {
+      type: mergedConfig.openGraph?.type,
+      siteName: mergedConfig.openGraph?.siteName,
+      locale: mergedConfig.openGraph?.locale,
+      images: mergedConfig.openGraph?.images,
+      title: mergedConfig.title,
+      description: mergedConfig.description,
+      url: mergedConfig.canonicalUrl,
+    },
+    twitter: {
+      card: mergedConfig.twitter?.card,
+      site: mergedConfig.twitter?.site,
+      creator: mergedConfig.twitter?.creator,
+      title: mergedConfig.title,
+      description: mergedConfig.description,
+      images: mergedConfig.openGraph?.images?.[0]?.url,
+    },
+  }
+}
+
+function legacyGenerateBlogSEOMetadata(articleData: BlogArticleData) {
+  return legacyGenerateSEOMetadata({
+    title: `${articleData.title} - ${seoConfig.blog.title}`,
+    description: articleData.description,
+    keywords: articleData.keywords || seoConfig.blog.keywords,
+    author: articleData.author,
+    canonicalUrl: articleData.url,
+    openGraph: {
+      ...seoConfig.blog.openGraph,
+      type: 'article',
+      images: articleData.image
+        ? [
+            {
+              url: articleData.image,
+              width: 1200,
+              height: 630,
+              alt: articleData.title,
+            },
+          ]
+        : seoConfig.blog.openGraph.images,
+    },
+  })
+}
+
+function legacyGenerateArticleStructuredData(data: BlogArticleData): string {
+  const structuredData = seoConfig.blog.structuredData
+
+  const articleStructuredData = {
+    ...structuredData.article,
+    headline: data.title,
+    description: data.description,
+    image: data.image || structuredData.organization.logo.url,
+    author: {
+      '@type': 'Person',
+      name: data.author,
+    },
+    datePublished: data.datePublished,
+    dateModified: data.dateModified || data.datePublished,
+    mainEntityOfPage: {
+      '@type': 'WebPage',
+      '@id': data.url,
+    },
+    keywords: data.keywords?.join(', ') || '',
+    articleSection: data.category || '技术文章',
+    wordCount: data.wordCount,
+  }
+
+  return JSON.stringify(
+    [
+      structuredData.website,
+      structuredData.organization,
+      structuredData.blog,
+      articleStructuredData,
+    ],
+    null,
+    pretty ? 2 : undefined
+  )
+}
+
+// ---- 基准 ----
+
+function createArticles(count: number, prefix = ''): BlogArticleData[] {
+  return Array.from({ length: count }, (_, i) => ({
+    title: `基准测试文章 ${prefix}${i}`,
+    description: `第 ${i} 篇文章的描述，用于衡量 SEO metadata 的生成开销。`,
+    image: i % 2 === 0 ? `/images/post-${i}.jpg` : undefined,
+    author: '基准测试',
+    datePublished: '2024-01-15T10:00:00+08:00',
+    dateModified: '2024-01-16T15:30:00+08:00',
+    url: `https://example.com/blog/${prefix}post-${i}`,
+    keywords: ['Next.js', 'SEO', `关键词${i}`],
+    category: '前端开发',
+    wordCount: 1000 + i,
+  }))
+}
+
+const articles = createArticles(ARTICLE_COUNT)
+const missArticles = createArticles(MISS_ARTICLE_COUNT, 'miss-')
+
+function bench(
+  name: string,
+  fn: (article: BlogArticleData) => unknown,
+  inputs: BlogArticleData[] = articles
+) {
+  // 预热
+  for (let i = 0; i < Math.min(ITERATIONS, 10000); i++) {
+    fn(inputs[i % inputs.length])
+  }
+
+  const start = performance.now()
+  for (let i = 0; i < ITERATIONS; i++) {
+    fn(inputs[i % inputs.length])
+  }
+  const elapsed = performance.now() - start
+
+  return {
+    name,
+    totalMs: Number(elapsed.toFixed(2)),
+    nsPerOp: Math.round((elapsed * 1e6) / ITERATIONS),
+  }
+}
+
+function main() {
+  // 两种实现的输出必须一致
+  for (const article of articles) {
+    if (
+      generateStructuredData('article', article) !==
+      legacyGenerateArticleStructuredData(article)
+    ) {
+      throw new Error(`Structured data mismatch for ${article.url}`)
+    }
+  }
+
+  const structuredData = (article: BlogArticleData) =>
+    generateStructuredData('article', article)
+
+  const results = [
+    bench('metadata (legacy)', legacyGenerateBlogSEOMetadata),
+    bench('metadata (precompiled + LRU)', generateBlogSEOMetadata),
+    bench(
+      'metadata (precompiled, LRU miss)',
+      generateBlogSEOMetadata,
+      missArticles
+    ),
+    bench('json-ld (legacy)', legacyGenerateArticleStructuredData),
+    bench('json-ld (precompiled + LRU)', structuredData),
+    bench('json-ld (precompiled, LRU miss)', structuredData, missArticles),
+  ]
+
+  console.log(
+    `SEO benchmark: ${ITERATIONS} iterations, ${ARTICLE_COUNT} articles ` +
+      `(${MISS_ARTICLE_COUNT} for LRU miss), ${
+        pretty ? 'pretty' : 'compact'
+      } JSON-LD`
+  )
+  console.table(results)
+}
+
+main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env node
+// 搜索索引构建步骤：读取博客目录下的 `<slug>.md`，
+// 按标题、描述、关键词和分类建立倒排索引，写入 src/generated/search-index.bin。
+//
+// 在 predev / prebuild 中自动执行，也可以手动运行：node scripts/build-search-index.mjs
+// 文章目录与运行时一致，可通过 BLOG_CONTENT_DIR 覆盖（默认 content/blog）。
+
+import { promises as fs } from 'node:fs'
+import path from 'node:path'
+import { fileURLToPath } from 'node:url'
+import { readFrontmatter } from '../src/lib/content/frontmatter.mjs'
+import { SLUG_PATTERN, toPostSummary } from '../src/lib/content/post-fields.mjs'
+import {
+  buildSearchIndex,
+  serializeSearchIndex,
+} from '../src/lib/search/core.mjs'
+
+const ROOT = path.resolve(path.dirname(fileURLToPath(import.meta.url)), '..')
+const CONTENT_DIR =
+  process.env.BLOG_CONTENT_DIR || path.join(ROOT, 'content', 'blog')
+const OUTPUT_FILE = path.join(ROOT, 'src', 'generated', 'search-index.bin')
+
+const READ_CONCURRENCY = 64
+
+async function listSlugs() {
+  let files
+  try {
+    files = await fs.readdir(CONTENT_DIR)
+  } catch (error) {
+    if (error.code === 'ENOENT') {
+      return []
+    }
+    throw error
+  }
+
+  return files
+    .filter(file => file.endsWith('.md'))
+    .map(file => file.slice(0, -'.md'.length))
+    .filter(slug => SLUG_PATTERN.test(slug))
+    .sort()
+}
+
+// 与运行时数据源使用同一份字段映射，只读取 frontmatter
+async function readDocument(slug) {
+  const { data, mtime } = await readFrontmatter(
+    path.join(CONTENT_DIR, `${slug}.md`)
+  )
+  return toPostSummary(slug, data, mtime)
+}
+
+async function main() {
+  const start = performance.now()
+  const slugs = await listSlugs()
+
+  const documents = []
+  for (let i = 0; i < slugs.length; i += READ_CONCURRENCY) {
+    documents.push(
+      ...(await Promise.all(
+        slugs.slice(i, i + READ_CONCURRENCY).map(readDocument)
+      ))
+    )
+  }
+
+  const data = buildSearchIndex(documents)
+  const serialized = serializeSearchIndex(data)
+
+  await fs.mkdir(path.dirname(OUTPUT_FILE), { recursive: true })
+  await fs.writeFile(OUTPUT_FILE, serialized)
+  console.log(
+    `Search index written to ${path.relative(ROOT, OUTPUT_FILE)} ` +
+      `(${data.docs.length} posts, ${data.terms.length} terms, ` +
+      `${(serialized.length / 1024).toFixed(1)} KB, ` +
+      `${(performance.now() - start).toFixed(0)} ms)`
+  )
+}
+
+main().catch(error => {
+  console.error(error)
+  process.exit(1)
+})
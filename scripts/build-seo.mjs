@@ -0,0 +1,270 @@
+#!/usr/bin/env node
+// SEO 构建步骤：按 src/config/seo.schema.json 校验 src/config/seo.json，并生成两份静态产物：
+//   - public/robots.txt：合并去重后的 robots.txt，作为静态文件直接由 Next 提供（自带 ETag / 304）
+//   - src/generated/seo-artifacts.json：预序列化的 website / organization / blog JSON-LD 片段
+//
+// 两份产物都提交到仓库，修改 seo.json 后需要重新生成：
+//   npm run seo:build                     重新生成产物（predev 中自动执行）
+//   node scripts/build-seo.mjs --check    只校验，产物与 seo.json 不一致时以非零状态退出（prebuild 中自动执行）
+
+import { promises as fs } from 'node:fs'
+import path from 'node:path'
+import { fileURLToPath } from 'node:url'
+
+const ROOT = path.resolve(path.dirname(fileURLToPath(import.meta.url)), '..')
+const CONFIG_FILE = path.join(ROOT, 'src', 'config', 'seo.json')
+const SCHEMA_FILE = path.join(ROOT, 'src', 'config', 'seo.schema.json')
+const ARTIFACTS_FILE = path.join(ROOT, 'src', 'generated', 'seo-artifacts.json')
+const ROBOTS_FILE = path.join(ROOT, 'public', 'robots.txt')
+
+// ---- 校验 ----
+
+function typeOf(value) {
+  if (Array.isArray(value)) {
+    return 'array'
+  }
+  if (value === null) {
+    return 'null'
+  }
+  if (Number.isInteger(value)) {
+    return 'integer'
+  }
+  return typeof value
+}
+
+function resolveRef(root, ref) {
+  if (!ref.startsWith('#/')) {
+    throw new Error(`Unsupported $ref: ${ref}`)
+  }
+  return ref
+    .slice(2)
+    .split('/')
+    .reduce((node, key) => node[key], root)
+}
+
+function isUri(value) {
+  try {
+    return Boolean(new URL(value).protocol)
+  } catch {
+    return false
+  }
+}
+
+// 只实现 seo.schema.json 用到的 JSON Schema 子集
+function validate(value, schema, root, pointer, errors) {
+  if (schema.$ref) {
+    validate(value, resolveRef(root, schema.$ref), root, pointer, errors)
+    return
+  }
+
+  for (const subschema of schema.allOf || []) {
+    validate(value, subschema, root, pointer, errors)
+  }
+
+  const actualType = typeOf(value)
+  if (schema.type) {
+    const matches =
+      schema.type === actualType ||
+      (schema.type === 'number' && actualType === 'integer')
+    if (!matches) {
+      errors.push(
+        `${pointer || '/'}: expected ${schema.type}, got ${actualType}`
+      )
+      return
+    }
+  }
+
+  if (schema.enum && !schema.enum.includes(value)) {
+    const allowed = schema.enum.map(v => JSON.stringify(v)).join(', ')
+    errors.push(`${pointer}: must be one of ${allowed}`)
+  }
+
+  if (actualType === 'string') {
+    if (schema.minLength !== undefined && value.length < schema.minLength) {
+      errors.push(`${pointer}: must not be empty`)
+    }
+    if (schema.pattern && !new RegExp(schema.pattern).test(value)) {
+      errors.push(`${pointer}: must match ${schema.pattern}`)
+    }
+    if (schema.format === 'uri' && !isUri(value)) {
+      errors.push(`${pointer}: must be an absolute URL`)
+    }
+    if (
+      schema.format === 'uri-reference' &&
+      !isUri(value) &&
+      !value.startsWith('/')
+    ) {
+      errors.push(`${pointer}: must be an absolute URL or a path`)
+    }
+  }
+
+  if (
+    (actualType === 'number' || actualType === 'integer') &&
+    schema.minimum !== undefined &&
+    value < schema.minimum
+  ) {
+    errors.push(`${pointer}: must be >= ${schema.minimum}`)
+  }
+
+  if (actualType === 'array') {
+    if (schema.minItems !== undefined && value.length < schema.minItems) {
+      errors.push(`${pointer}: must have at least ${schema.minItems} item(s)`)
+    }
+    if (schema.items) {
+      value.forEach((item, i) =>
+        validate(item, schema.items, root, `${pointer}/${i}`, errors)
+      )
+    }
+  }
+
+  if (actualType === 'object') {
+    for (const key of schema.required || []) {
+      if (!(key in value)) {
+        errors.push(`${pointer}/${key}: is required`)
+      }
+    }
+    for (const [key, child] of Object.entries(value)) {
+      const childSchema = schema.properties?.[key]
+      if (childSchema) {
+        validate(child, childSchema, root, `${pointer}/${key}`, errors)
+      } else if (schema.additionalProperties === false) {
+        errors.push(`${pointer}/${key}: unknown property`)
+      }
+    }
+  }
+}
+
+// ---- robots.txt ----
+
+function unique(values = []) {
+  return [...new Set(values)]
+}
+
+// 合并 allow / disallow / crawlDelay 完全相同的规则，多个 User-Agent 共享一个规则组
+function compileRobotsTxt(robots, siteUrl) {
+  const groups = new Map()
+  for (const rule of robots.rules) {
+    const directives = {
+      allow: unique(rule.allow),
+      disallow: unique(rule.disallow),
+      crawlDelay: rule.crawlDelay,
+    }
+    const key = JSON.stringify(directives)
+    const group = groups.get(key) || { userAgents: [], ...directives }
+    group.userAgents = unique([...group.userAgents, ...rule.userAgent])
+    groups.set(key, group)
+  }
+
+  let text = ''
+  for (const group of groups.values()) {
+    for (const userAgent of group.userAgents) {
+      text += `User-Agent: ${userAgent}\n`
+    }
+    for (const allow of group.allow) {
+      text += `Allow: ${allow}\n`
+    }
+    for (const disallow of group.disallow) {
+      text += `Disallow: ${disallow}\n`
+    }
+    if (group.crawlDelay !== undefined) {
+      text += `Crawl-delay: ${group.crawlDelay}\n`
+    }
+    text += '\n'
+  }
+  text += `Sitemap: ${siteUrl.replace(/\/$/, '')}/sitemap.xml\n`
+  return text
+}
+
+// ---- 结构化数据 ----
+
+// 片段会被写入 <script type="application/ld+json">，转义 < 防止 </script> 提前结束标签；
+// U+2028 / U+2029 一并转义。与 src/lib/seo.ts 的 escapeJsonForHtml 保持一致
+function escapeJsonForHtml(json) {
+  return json
+    .replace(/</g, '\\u003c')
+    .replace(/\u2028/g, '\\u2028')
+    .replace(/\u2029/g, '\\u2029')
+}
+
+function serializeNodes(nodes) {
+  const compact = {}
+  const pretty = {}
+  const prettyFragment = {}
+  for (const [name, node] of Object.entries(nodes)) {
+    compact[name] = escapeJsonForHtml(JSON.stringify(node))
+    pretty[name] = escapeJsonForHtml(JSON.stringify(node, null, 2))
+    // 作为数组元素时的缩进，与 JSON.stringify(array, null, 2) 一致
+    prettyFragment[name] = pretty[name].replace(/\n/g, '\n  ')
+  }
+  return { compact, pretty, prettyFragment }
+}
+
+async function readFileIfExists(file) {
+  try {
+    return await fs.readFile(file, 'utf8')
+  } catch (error) {
+    if (error.code === 'ENOENT') {
+      return null
+    }
+    throw error
+  }
+}
+
+async function main() {
+  const checkOnly = process.argv.slice(2).includes('--check')
+  const [config, schema] = await Promise.all([
+    fs.readFile(CONFIG_FILE, 'utf8').then(JSON.parse),
+    fs.readFile(SCHEMA_FILE, 'utf8').then(JSON.parse),
+  ])
+
+  const errors = []
+  validate(config, schema, schema, '', errors)
+  if (errors.length > 0) {
+    console.error(`Invalid ${path.relative(ROOT, CONFIG_FILE)}:`)
+    for (const error of errors) {
+      console.error(`  - ${error}`)
+    }
+    process.exit(1)
+  }
+
+  const robotsTxt = compileRobotsTxt(config.robots, config.defaults.siteUrl)
+  const { website, organization, blog } = config.blog.structuredData
+  const artifacts = {
+    structuredData: serializeNodes({ website, organization, blog }),
+  }
+  const outputs = [
+    [ROBOTS_FILE, robotsTxt],
+    [ARTIFACTS_FILE, `${JSON.stringify(artifacts, null, 2)}\n`],
+  ]
+
+  if (checkOnly) {
+    const stale = []
+    for (const [file, content] of outputs) {
+      if ((await readFileIfExists(file)) !== content) {
+        stale.push(path.relative(ROOT, file))
+      }
+    }
+    if (stale.length > 0) {
+      console.error(
+        'SEO artifacts are out of date, run npm run seo:build and commit:'
+      )
+      for (const file of stale) {
+        console.error(`  - ${file}`)
+      }
+      process.exit(1)
+    }
+    console.log('SEO artifacts are up to date.')
+    return
+  }
+
+  for (const [file, content] of outputs) {
+    await fs.mkdir(path.dirname(file), { recursive: true })
+    await fs.writeFile(file, content)
+    console.log(`SEO artifact written to ${path.relative(ROOT, file)}`)
+  }
+}
+
+main().catch(error => {
+  console.error(error)
+  process.exit(1)
+})
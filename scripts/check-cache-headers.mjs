@@ -0,0 +1,119 @@
+#!/usr/bin/env node
+// 缓存响应头校验：对运行中的生产服务逐个请求 src/config/cache-policy.json 中声明的路由，
+// 断言 Cache-Control 与策略一致，并验证声明了 conditional 的路由对 If-None-Match 返回 304。
+//
+// 用法：
+//   npm run build && npm run start
+//   npm run check:cache -- --base-url=http://localhost:3000
+
+import { readFileSync } from 'node:fs'
+import path from 'node:path'
+import { fileURLToPath } from 'node:url'
+
+const ROOT = path.resolve(path.dirname(fileURLToPath(import.meta.url)), '..')
+const config = JSON.parse(
+  readFileSync(path.join(ROOT, 'src', 'config', 'cache-policy.json'), 'utf8')
+)
+
+function parseArgs(argv) {
+  let baseUrl = 'http://localhost:3000'
+  for (const arg of argv) {
+    if (arg.startsWith('--base-url=')) {
+      baseUrl = arg.slice('--base-url='.length)
+    } else {
+      throw new Error(`Unknown option: ${arg}`)
+    }
+  }
+  return baseUrl.replace(/\/$/, '')
+}
+
+// 比较时忽略指令顺序和空白
+function normalize(cacheControl) {
+  return (cacheControl || '')
+    .split(',')
+    .map(directive => directive.trim().toLowerCase())
+    .filter(Boolean)
+    .sort()
+    .join(', ')
+}
+
+async function get(baseUrl, pathname, headers = {}) {
+  return fetch(`${baseUrl}${pathname}`, { headers, redirect: 'manual' })
+}
+
+async function main() {
+  const baseUrl = parseArgs(process.argv.slice(2))
+  const failures = []
+  let checked = 0
+
+  function expect(condition, message) {
+    checked++
+    if (!condition) {
+      failures.push(message)
+    }
+  }
+
+  for (const route of config.routes) {
+    if (!route.sample) {
+      continue
+    }
+
+    const response = await get(baseUrl, route.sample)
+    const cacheControl = response.headers.get('cache-control')
+    expect(
+      response.status === 200,
+      `${route.sample}: expected 200, got ${response.status}`
+    )
+
+    if (route.framework) {
+      // Next.js 按 revalidate 生成 Cache-Control，只要求可被 CDN 缓存
+      expect(
+        /s-maxage=\d+/.test(cacheControl || ''),
+        `${route.sample}: expected s-maxage, got "${cacheControl}"`
+      )
+    } else {
+      const expected = config.policies[route.policy]
+      expect(
+        normalize(cacheControl) === normalize(expected),
+        `${route.sample}: expected "${expected}", got "${cacheControl}"`
+      )
+    }
+
+    if (route.conditional) {
+      const etag = response.headers.get('etag')
+      expect(Boolean(etag), `${route.sample}: missing ETag`)
+      if (etag) {
+        const revalidated = await get(baseUrl, route.sample, {
+          'If-None-Match': etag,
+        })
+        expect(
+          revalidated.status === 304,
+          `${route.sample}: expected 304 for matching ETag, got ${revalidated.status}`
+        )
+      }
+    }
+  }
+
+  for (const page of config.pages) {
+    const response = await get(baseUrl, page)
+    const cacheControl = response.headers.get('cache-control')
+    expect(
+      response.status === 200 && /s-maxage=\d+/.test(cacheControl || ''),
+      `${page}: expected cacheable 200, got ${response.status} "${cacheControl}"`
+    )
+  }
+
+  if (failures.length > 0) {
+    console.error(`Cache header check failed (${failures.length}/${checked}):`)
+    for (const failure of failures) {
+      console.error(`  - ${failure}`)
+    }
+    process.exit(1)
+  }
+  console.log(`Cache header check passed (${checked} assertions).`)
+}
+
+main().catch(error => {
+  console.error(error)
+  process.exit(1)
+})
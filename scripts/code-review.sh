@@ -7,15 +7,26 @@ set -e  # 遇到错误立即退出
 DEFAULT_Q_ACCOUNT_PATH="${HOME}/.local/share/amazon-q"
 DEFAULT_Q_IMAGE="ghcr.io/kun-g/q:latest"
 DEFAULT_REVIEW_STANDARDS_FILE="docs/specs/code_review_standards.md"
+DEFAULT_REVIEW_BACKEND="q"
+DEFAULT_REVIEW_JOBS=4
+DEFAULT_REVIEW_CACHE_DIR="${XDG_CACHE_HOME:-${HOME}/.cache}/code-review"
 
 # 加载配置文件
 load_config() {
     local config_file="${HOME}/.code-review-config"
     
+    # 记录环境变量中的设置，优先级：命令行参数 > 环境变量 > 配置文件 > 默认值
+    local env_backend="${REVIEW_BACKEND:-}"
+    local env_jobs="${REVIEW_JOBS:-}"
+    local env_cache_dir="${REVIEW_CACHE_DIR:-}"
+    
     # 设置默认值
     Q_ACCOUNT_PATH="$DEFAULT_Q_ACCOUNT_PATH"
     Q_IMAGE="$DEFAULT_Q_IMAGE"
     REVIEW_STANDARDS_FILE="$DEFAULT_REVIEW_STANDARDS_FILE"
+    REVIEW_BACKEND="$DEFAULT_REVIEW_BACKEND"
+    REVIEW_JOBS="$DEFAULT_REVIEW_JOBS"
+    REVIEW_CACHE_DIR="$DEFAULT_REVIEW_CACHE_DIR"
     
     # 如果存在配置文件，则加载
     if [[ -f "$config_file" ]]; then
@@ -41,9 +52,23 @@ load_config() {
                 REVIEW_STANDARDS_FILE)
                     REVIEW_STANDARDS_FILE="$value"
                     ;;
+                REVIEW_BACKEND)
+                    REVIEW_BACKEND="$value"
+                    ;;
+                REVIEW_JOBS)
+                    REVIEW_JOBS="$value"
+                    ;;
+                REVIEW_CACHE_DIR)
+                    REVIEW_CACHE_DIR="$value"
+                    ;;
             esac
         done < "$config_file"
     fi
+    
+    # 环境变量覆盖配置文件，例如 REVIEW_BACKEND=stub ./scripts/code-review.sh --batch
+    REVIEW_BACKEND="${env_backend:-$REVIEW_BACKEND}"
+    REVIEW_JOBS="${env_jobs:-$REVIEW_JOBS}"
+    REVIEW_CACHE_DIR="${env_cache_dir:-$REVIEW_CACHE_DIR}"
 }
 
 # 颜色输出
@@ -64,10 +89,22 @@ show_help() {
     echo "  -h, --help       显示帮助信息"
     echo "  -c, --commits N  审查最近 N 个 commit (默认: 1)"
     echo "  --account PATH   指定 Amazon Q 账户路径"
+    echo "  -b, --batch      批量模式：逐个审查最近 N 个 commit，并发执行并缓存结果"
+    echo "  -j, --jobs N     批量模式的并发数 (默认: $DEFAULT_REVIEW_JOBS)"
+    echo "  --backend NAME   审查后端：q (Amazon Q 容器) 或 stub (离线桩实现，用于测试)"
+    echo "  --no-cache       批量模式下忽略已缓存的审查结果"
     echo ""
     echo "示例:"
     echo "  $0                           # 审查最近 1 个 commit"
     echo "  $0 --commits 3               # 审查最近 3 个 commit"
+    echo "  $0 --batch -c 10 -j 4        # 4 个并发逐个审查最近 10 个 commit"
+    echo "  $0 --batch -c 5 --backend stub  # 不启动容器，离线验证批量模式"
+    echo ""
+    echo "批量模式按 diff 内容哈希缓存审查结果 (目录: $DEFAULT_REVIEW_CACHE_DIR)，"
+    echo "重复运行时未变更的 commit 直接使用缓存。"
+    echo ""
+    echo "环境变量 REVIEW_BACKEND、REVIEW_JOBS、REVIEW_CACHE_DIR 覆盖配置文件中的同名设置，"
+    echo "命令行参数优先于环境变量。"
     echo ""
 }
 
@@ -89,10 +126,14 @@ warn() {
 
 # 检查前置条件
 check_prerequisites() {
-    # 检查 podman
-    if ! command -v podman &> /dev/null; then
-        error_exit "未找到 podman 命令，请先安装 podman"
-    fi
+    # 检查审查后端
+    case "$REVIEW_BACKEND" in
+        q|stub)
+            ;;
+        *)
+            error_exit "未知的审查后端: $REVIEW_BACKEND（可选: q、stub）"
+            ;;
+    esac
 
     # 检查 git 仓库
     if ! git rev-parse --git-dir &> /dev/null; then
@@ -105,6 +146,16 @@ check_prerequisites() {
         warn "将使用默认审查标准"
     fi
 
+    # 桩后端不需要容器和账户
+    if [[ "$REVIEW_BACKEND" == "stub" ]]; then
+        return 0
+    fi
+
+    # 检查 podman
+    if ! command -v podman &> /dev/null; then
+        error_exit "未找到 podman 命令，请先安装 podman"
+    fi
+
     # 检查 Amazon Q 账户路径
     if [[ ! -d "$Q_ACCOUNT_PATH" ]]; then
         error_exit "Amazon Q 账户路径不存在: $Q_ACCOUNT_PATH"
@@ -128,16 +179,12 @@ get_code_changes() {
     echo "# 最近 $COMMIT_COUNT 个 commit 的变更"$'\n```diff\n'"$changes"$'\n```'
 }
 
-# 构建审查提示词
-build_review_prompt() {
-    local code_changes="$1"
-    local review_standards=""
-    
-    # 读取审查标准
+# 读取审查标准（只读取一次，批量模式下所有 commit 共用）
+load_review_standards() {
     if [[ -f "$REVIEW_STANDARDS_FILE" ]]; then
-        review_standards=$(cat "$REVIEW_STANDARDS_FILE")
+        REVIEW_STANDARDS=$(cat "$REVIEW_STANDARDS_FILE")
     else
-        review_standards="请基于以下标准进行代码审查：
+        REVIEW_STANDARDS="请基于以下标准进行代码审查：
 1. 类型安全问题 - 避免any类型，正确处理null/undefined
 2. 异步操作处理 - Promise错误处理，避免串行执行  
 3. React组件问题 - useEffect依赖，state不可变性
@@ -147,6 +194,11 @@ build_review_prompt() {
 7. 代码结构问题 - 组件职责单一，减少嵌套复杂度
 8. 可访问性问题 - 语义化标签，键盘导航支持"
     fi
+}
+
+# 构建审查提示词
+build_review_prompt() {
+    local code_changes="$1"
     
     cat << EOF
 # 🔍 代码审查任务
@@ -155,7 +207,7 @@ build_review_prompt() {
 
 ## 📋 审查标准
 
-$review_standards
+$REVIEW_STANDARDS
 
 ## 📝 待审查代码
 
@@ -198,7 +250,15 @@ run_amazon_q_review() {
     fi
     
     # 使用临时文件作为输入，提高安全性
-    if podman run -i --rm \
+    # 批量模式下复用同一个常驻容器，避免每个 commit 都启动新容器
+    if [[ -n "$Q_CONTAINER" ]]; then
+        if podman exec -i "$Q_CONTAINER" \
+            q chat --no-interactive --trust-all-tools < "$temp_file"; then
+            exit_code=0
+        else
+            exit_code=$?
+        fi
+    elif podman run -i --rm \
         -v "$(pwd):/home/quser/workspace:ro" \
         -v "$Q_ACCOUNT_PATH:/home/quser/.local/share/amazon-q:ro" \
         "$Q_IMAGE" \
@@ -206,6 +266,9 @@ run_amazon_q_review() {
         exit_code=0
     else
         exit_code=$?
+    fi
+
+    if [[ $exit_code -ne 0 ]]; then
         case $exit_code in
             1)
                 error_exit "Amazon Q 命令执行失败"
@@ -228,11 +291,223 @@ run_amazon_q_review() {
     return $exit_code
 }
 
+# 离线桩审查后端：不启动容器，根据 diff 生成确定性的审查报告，用于离线测试批量模式
+# STUB_REVIEW_DELAY 控制模拟的审查耗时（秒，默认 1）
+run_stub_review() {
+    local prompt="$1"
+    local stats
+
+    sleep "${STUB_REVIEW_DELAY:-1}"
+
+    stats=$(printf '%s\n' "$prompt" | awk '
+        /^diff --git / { files++; next }
+        /^(\+\+\+|---) / { next }
+        /^\+/ { added++ }
+        /^-/ { removed++ }
+        END { printf "%d 个文件，+%d / -%d 行", files, added, removed }
+    ')
+
+    cat << EOF
+# 🔍 代码审查报告（stub 后端）
+
+1. **📁 审查范围** - $stats
+2. **⚠️ 问题分析** - stub 后端不做实际分析
+3. **✅ 审查摘要** - 用于验证批量审查流程，请使用 --backend q 进行真实审查
+EOF
+}
+
+# 按配置的后端执行审查
+run_review() {
+    case "$REVIEW_BACKEND" in
+        stub)
+            run_stub_review "$1"
+            ;;
+        *)
+            run_amazon_q_review "$1"
+            ;;
+    esac
+}
+
+# 计算标准输入的 sha256（兼容 Linux 和 macOS）
+hash_stdin() {
+    if command -v sha256sum &> /dev/null; then
+        sha256sum | cut -d' ' -f1
+    else
+        shasum -a 256 | cut -d' ' -f1
+    fi
+}
+
+# 当前时间（毫秒），bash 5 使用 EPOCHREALTIME，否则精确到秒
+now_ms() {
+    if [[ -n "${EPOCHREALTIME:-}" ]]; then
+        local now="${EPOCHREALTIME/[.,]/}"
+        echo $((now / 1000))
+    else
+        echo $(($(date +%s) * 1000))
+    fi
+}
+
+# 毫秒格式化为 12.3s
+format_duration() {
+    printf '%d.%ds' $(($1 / 1000)) $(($1 % 1000 / 100))
+}
+
+# 批量模式：启动一个常驻容器，所有 commit 的审查通过 podman exec 复用它
+start_q_container() {
+    # 验证容器镜像名称（基本安全检查）
+    if [[ ! "$Q_IMAGE" =~ ^[a-zA-Z0-9._/-]+:[a-zA-Z0-9._-]+$ ]] && [[ ! "$Q_IMAGE" =~ ^[a-zA-Z0-9._/-]+$ ]]; then
+        error_exit "无效的容器镜像名称: $Q_IMAGE"
+    fi
+
+    Q_CONTAINER="code-review-$$"
+    if ! podman run -d --rm --name "$Q_CONTAINER" \
+        -v "$(pwd):/home/quser/workspace:ro" \
+        -v "$Q_ACCOUNT_PATH:/home/quser/.local/share/amazon-q:ro" \
+        --entrypoint sleep \
+        "$Q_IMAGE" infinity > /dev/null; then
+        Q_CONTAINER=""
+        error_exit "容器运行失败，请检查 podman 安装和镜像可用性"
+    fi
+}
+
+# 批量模式结束时清理临时目录和常驻容器
+cleanup_batch() {
+    if [[ -n "$Q_CONTAINER" ]]; then
+        podman rm -f "$Q_CONTAINER" &> /dev/null || true
+    fi
+    rm -rf "$WORK_DIR"
+}
+
+# 批量模式的单个任务：审查一个 commit，结果写入 $WORK_DIR/<序号>.{review,log,status}
+review_commit() {
+    local index="$1"
+    local commit="$2"
+    local total="$3"
+    local out="$WORK_DIR/$index"
+    local start status title changes diff_block prompt key cache_file duration
+
+    start=$(now_ms)
+    title=$(git log -1 --format='%h %s' "$commit")
+    changes=$(git show --no-color --format= --patch "$commit")
+    : > "$out.review"
+
+    if [[ -z "$changes" ]]; then
+        status="无变更"
+    else
+        diff_block=$'```diff\n'"$changes"$'\n```'
+        # 缓存键只包含后端、镜像和不带 commit 标题的提示词（审查标准 + diff），
+        # 审查标准变化时缓存自动失效；rebase 或修改提交说明后 diff 不变时仍然命中
+        key=$(printf '%s\n%s\n%s' "$REVIEW_BACKEND" "$Q_IMAGE" "$(build_review_prompt "$diff_block")" | hash_stdin)
+        cache_file="$REVIEW_CACHE_DIR/$key.md"
+        prompt=$(build_review_prompt "# commit $title 的变更"$'\n'"$diff_block")
+
+        if [[ "$USE_CACHE" == "true" && -f "$cache_file" ]]; then
+            cp "$cache_file" "$out.review"
+            status="缓存命中"
+        elif (run_review "$prompt") > "$out.review" 2> "$out.log"; then
+            # 先写临时文件再重命名，避免并发任务读到写了一半的缓存
+            cp "$out.review" "$cache_file.$index.tmp"
+            mv "$cache_file.$index.tmp" "$cache_file"
+            status="审查完成"
+        else
+            status="审查失败"
+        fi
+    fi
+
+    duration=$(($(now_ms) - start))
+    printf '%s\t%s\n' "$status" "$duration" > "$out.status"
+    echo "  [$((index + 1))/$total] $title - $status ($(format_duration "$duration"))"
+}
+
+# 批量模式：逐个审查最近 N 个 commit，最多 REVIEW_JOBS 个任务并发
+run_batch_review() {
+    local commits=()
+    local pids=()
+    local commit pid index status duration batch_start wall
+    local total_ms=0
+    local failed=0
+
+    # bash 3.2 没有 mapfile，逐行读取（按时间正序）
+    while IFS= read -r commit; do
+        commits+=("$commit")
+    done < <(git rev-list --no-merges --reverse --max-count="$COMMIT_COUNT" HEAD)
+
+    if [[ ${#commits[@]} -eq 0 ]]; then
+        error_exit "仓库中没有可审查的 commit"
+    fi
+    if [[ ${#commits[@]} -lt $COMMIT_COUNT ]]; then
+        warn "只有 ${#commits[@]} 个非合并 commit 可审查"
+    fi
+
+    mkdir -p "$REVIEW_CACHE_DIR" || error_exit "无法创建缓存目录: $REVIEW_CACHE_DIR"
+    WORK_DIR=$(mktemp -d -t code-review.XXXXXX) || error_exit "无法创建临时目录"
+    trap cleanup_batch EXIT
+
+    if [[ "$REVIEW_BACKEND" == "q" ]]; then
+        start_q_container
+    fi
+
+    echo -e "${BLUE}批量审查 ${#commits[@]} 个 commit（后端: $REVIEW_BACKEND，并发数: $REVIEW_JOBS）${NC}"
+    batch_start=$(now_ms)
+
+    # 有界任务池：任务数达到上限时等待最早启动的任务结束（兼容没有 wait -n 的 bash 3.2）
+    index=0
+    for commit in "${commits[@]}"; do
+        if [[ ${#pids[@]} -ge $REVIEW_JOBS ]]; then
+            wait "${pids[0]}" || true
+            pids=("${pids[@]:1}")
+        fi
+        review_commit "$index" "$commit" "${#commits[@]}" &
+        pids+=($!)
+        index=$((index + 1))
+    done
+    for pid in "${pids[@]}"; do
+        wait "$pid" || true
+    done
+    wall=$(($(now_ms) - batch_start))
+
+    # 按 commit 顺序输出审查结果
+    for ((index = 0; index < ${#commits[@]}; index++)); do
+        echo ""
+        echo -e "${BLUE}===== $(git log -1 --format='%h %s' "${commits[$index]}") =====${NC}"
+        cat "$WORK_DIR/$index.review"
+        if [[ -s "$WORK_DIR/$index.log" ]]; then
+            cat "$WORK_DIR/$index.log" >&2
+        fi
+    done
+
+    # 每个 commit 的耗时统计
+    echo ""
+    echo -e "${BLUE}耗时统计:${NC}"
+    for ((index = 0; index < ${#commits[@]}; index++)); do
+        status="审查失败"
+        duration=0
+        if [[ -f "$WORK_DIR/$index.status" ]]; then
+            IFS=$'\t' read -r status duration < "$WORK_DIR/$index.status"
+        fi
+        if [[ "$status" == "审查失败" ]]; then
+            failed=$((failed + 1))
+        fi
+        total_ms=$((total_ms + duration))
+        printf '  %s  %8s  %s\n' "$(git rev-parse --short "${commits[$index]}")" "$(format_duration "$duration")" "$status"
+    done
+    echo "  合计 $(format_duration "$total_ms")，实际耗时 $(format_duration "$wall")"
+
+    if [[ $failed -gt 0 ]]; then
+        error_exit "$failed 个 commit 审查失败"
+    fi
+}
+
 # 主函数
 main() {
     # 解析命令行参数
     COMMIT_COUNT=1
     OVERRIDE_ACCOUNT_PATH=""
+    OVERRIDE_BACKEND=""
+    OVERRIDE_JOBS=""
+    BATCH_MODE="false"
+    USE_CACHE="true"
+    Q_CONTAINER=""
     
     while [[ $# -gt 0 ]]; do
         case $1 in
@@ -251,6 +526,22 @@ main() {
                 OVERRIDE_ACCOUNT_PATH="$2"
                 shift 2
                 ;;
+            -b|--batch)
+                BATCH_MODE="true"
+                shift
+                ;;
+            -j|--jobs)
+                OVERRIDE_JOBS="$2"
+                shift 2
+                ;;
+            --backend)
+                OVERRIDE_BACKEND="$2"
+                shift 2
+                ;;
+            --no-cache)
+                USE_CACHE="false"
+                shift
+                ;;
             -*)
                 error_exit "未知选项: $1"
                 ;;
@@ -267,10 +558,29 @@ main() {
     if [[ -n "$OVERRIDE_ACCOUNT_PATH" ]]; then
         Q_ACCOUNT_PATH="$OVERRIDE_ACCOUNT_PATH"
     fi
+    if [[ -n "$OVERRIDE_BACKEND" ]]; then
+        REVIEW_BACKEND="$OVERRIDE_BACKEND"
+    fi
+    if [[ -n "$OVERRIDE_JOBS" ]]; then
+        REVIEW_JOBS="$OVERRIDE_JOBS"
+    fi
+    if ! [[ "$REVIEW_JOBS" =~ ^[0-9]+$ ]] || [[ "$REVIEW_JOBS" -lt 1 ]]; then
+        error_exit "并发数必须是正整数"
+    fi
     
     # 检查前置条件
     check_prerequisites
     
+    # 读取审查标准
+    load_review_standards
+    
+    if [[ "$BATCH_MODE" == "true" ]]; then
+        run_batch_review
+        echo ""
+        success "批量代码审查完成！"
+        return 0
+    fi
+    
     # 获取代码变更
     local code_changes
     code_changes=$(get_code_changes)
@@ -282,7 +592,7 @@ main() {
     # 执行审查
     echo ""
     
-    if run_amazon_q_review "$review_prompt"; then
+    if run_review "$review_prompt"; then
         echo ""
         success "代码审查完成！"
     else
@@ -0,0 +1,124 @@
+#!/usr/bin/env node
+// 样式内联报告（postbuild，只读，不修改构建产物）。
+//
+// next.config.ts 启用了 experimental.inlineCss：Next 在渲染时把整份样式表内联到 <head>，
+// 构建时预渲染、ISR 重新生成和按需重新验证的页面都会内联。
+// 取舍：首次访问省去阻塞渲染的 CSS 请求，代价是每个 HTML 响应都带上整份样式表，
+// 页面之间不再共享浏览器缓存的样式表。这个脚本按路由输出这两方面的实际字节数，
+// 用于判断样式表增长后内联是否仍然划算：
+//   - 仍然阻塞渲染的外部样式表数量（启用 inlineCss 后应为 0）
+//   - 内联进 HTML 的样式表数量和字节数（gzip），即不内联时需要阻塞加载的 CSS
+//   - HTML 总字节数（gzip）及其中 CSS 所占的比例
+//
+// 报告写入 .next/css-report.json。
+
+import { promises as fs } from 'node:fs'
+import path from 'node:path'
+import { fileURLToPath } from 'node:url'
+import { gzipSync } from 'node:zlib'
+
+const ROOT = path.resolve(path.dirname(fileURLToPath(import.meta.url)), '..')
+const NEXT_DIR = path.join(ROOT, '.next')
+const APP_DIR = path.join(NEXT_DIR, 'server', 'app')
+const REPORT_FILE = path.join(NEXT_DIR, 'css-report.json')
+
+const STYLESHEET_LINK = /<link rel="stylesheet" href="[^"]+\.css"[^>]*>/g
+const INLINE_STYLE = /<style[^>]*>([\s\S]*?)<\/style>/g
+
+function htmlFileForRoute(route) {
+  return path.join(APP_DIR, `${route === '/' ? '/index' : route}.html`)
+}
+
+function gzipBytes(text) {
+  return text ? gzipSync(text).length : 0
+}
+
+async function measureRoute(route) {
+  let html
+  try {
+    html = await fs.readFile(htmlFileForRoute(route), 'utf8')
+  } catch (error) {
+    // 预渲染的路由处理器（sitemap 等）没有 HTML
+    if (error.code === 'ENOENT') {
+      return null
+    }
+    throw error
+  }
+
+  const styles = [...html.matchAll(INLINE_STYLE)].map(([, css]) => css)
+  const inlinedCss = styles.join('')
+  const htmlGzip = gzipBytes(html)
+  const inlinedGzip = gzipBytes(inlinedCss)
+
+  return {
+    route,
+    blockingStylesheets: [...html.matchAll(STYLESHEET_LINK)].length,
+    inlinedStylesheets: styles.length,
+    inlinedBytes: Buffer.byteLength(inlinedCss),
+    inlinedGzipBytes: inlinedGzip,
+    htmlGzipBytes: htmlGzip,
+    cssShareOfHtml:
+      htmlGzip > 0 ? Math.round((inlinedGzip / htmlGzip) * 100) / 100 : null,
+  }
+}
+
+function formatKB(bytes) {
+  return Number((bytes / 1024).toFixed(1))
+}
+
+async function main() {
+  let manifest
+  try {
+    manifest = JSON.parse(
+      await fs.readFile(path.join(NEXT_DIR, 'prerender-manifest.json'), 'utf8')
+    )
+  } catch {
+    console.error('No build output found, run next build first.')
+    process.exit(1)
+  }
+
+  const routes = []
+  for (const [route, info] of Object.entries(manifest.routes)) {
+    const result = await measureRoute(route)
+    if (result) {
+      routes.push({ ...result, revalidate: info.initialRevalidateSeconds })
+    }
+  }
+  routes.sort((a, b) => a.route.localeCompare(b.route))
+
+  await fs.writeFile(
+    REPORT_FILE,
+    `${JSON.stringify({ generatedAt: new Date().toISOString(), routes }, null, 2)}\n`
+  )
+
+  console.log(`CSS report for ${routes.length} prerendered route(s):`)
+  console.table(
+    Object.fromEntries(
+      routes.map(route => [
+        route.route,
+        {
+          'blocking stylesheets': route.blockingStylesheets,
+          'inlined stylesheets': route.inlinedStylesheets,
+          'inlined CSS (KB gz)': formatKB(route.inlinedGzipBytes),
+          'HTML (KB gz)': formatKB(route.htmlGzipBytes),
+          'CSS share': route.cssShareOfHtml ?? '-',
+          revalidate: route.revalidate,
+        },
+      ])
+    )
+  )
+
+  const blocking = routes.filter(route => route.blockingStylesheets > 0)
+  if (blocking.length > 0) {
+    console.warn(
+      `${blocking.length} route(s) still load render-blocking stylesheets, ` +
+        'check experimental.inlineCss in next.config.ts'
+    )
+  }
+  console.log(`Report written to ${path.relative(ROOT, REPORT_FILE)}`)
+}
+
+main().catch(error => {
+  console.error(error)
+  process.exit(1)
+})
@@ -0,0 +1,59 @@
+import { NextResponse } from 'next/server'
+import {
+  REVALIDATE_SIGNATURE_HEADER,
+  revalidateBlogPost,
+  verifyWebhookSignature,
+} from '@/lib/content/revalidate'
+
+const noStoreHeaders = { 'Cache-Control': 'no-store' }
+
+// 内容变更 webhook：请求体为 {"slug": "..."}，使用 REVALIDATE_SECRET 做 HMAC-SHA256 签名
+export async function POST(request: Request) {
+  const secret = process.env.REVALIDATE_SECRET
+  if (!secret) {
+    return NextResponse.json(
+      { error: 'REVALIDATE_SECRET is not configured' },
+      { status: 500, headers: noStoreHeaders }
+    )
+  }
+
+  const body = await request.text()
+  const signature = request.headers.get(REVALIDATE_SIGNATURE_HEADER)
+  if (!verifyWebhookSignature(body, signature, secret)) {
+    return NextResponse.json(
+      { error: 'Invalid signature' },
+      { status: 401, headers: noStoreHeaders }
+    )
+  }
+
+  let slug: unknown
+  try {
+    slug = (JSON.parse(body) as { slug?: unknown }).slug
+  } catch {
+    return NextResponse.json(
+      { error: 'Invalid JSON body' },
+      { status: 400, headers: noStoreHeaders }
+    )
+  }
+
+  if (typeof slug !== 'string' || !/^[a-zA-Z0-9_-]+$/.test(slug)) {
+    return NextResponse.json(
+      { error: 'A valid slug is required' },
+      { status: 400, headers: noStoreHeaders }
+    )
+  }
+
+  try {
+    const paths = await revalidateBlogPost(slug)
+    return NextResponse.json(
+      { revalidated: true, slug, paths },
+      { headers: noStoreHeaders }
+    )
+  } catch (error) {
+    console.error('Error revalidating blog post:', error)
+    return NextResponse.json(
+      { error: 'Revalidation failed' },
+      { status: 500, headers: noStoreHeaders }
+    )
+  }
+}
@@ -0,0 +1,38 @@
+import { NextResponse } from 'next/server'
+import { getCacheControl } from '@/lib/cache-policy'
+import { searchPosts } from '@/lib/search'
+
+// 查询串过长时直接拒绝，避免无意义的分词开销
+const MAX_QUERY_LENGTH = 200
+
+// 博客全文检索：GET /api/search/?q=关键词&limit=10
+export async function GET(request: Request) {
+  const { searchParams } = new URL(request.url)
+  const query = (searchParams.get('q') || '').trim()
+  const limit = Number(searchParams.get('limit') || 10)
+  const headers = { 'Cache-Control': getCacheControl('api') }
+
+  if (query.length > MAX_QUERY_LENGTH) {
+    return NextResponse.json(
+      { error: `Query must be at most ${MAX_QUERY_LENGTH} characters` },
+      { status: 400, headers }
+    )
+  }
+
+  if (!query) {
+    return NextResponse.json({ query, results: [], took: 0 }, { headers })
+  }
+
+  try {
+    const start = performance.now()
+    const results = searchPosts(query, limit)
+    const took = Math.round((performance.now() - start) * 1000) / 1000
+    return NextResponse.json({ query, results, took }, { headers })
+  } catch (error) {
+    console.error('Error searching blog posts:', error)
+    return NextResponse.json(
+      { error: 'Search failed' },
+      { status: 500, headers: { 'Cache-Control': 'no-store' } }
+    )
+  }
+}
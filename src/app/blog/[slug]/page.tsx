@@ -0,0 +1,100 @@
+import { Metadata } from 'next'
+import { notFound } from 'next/navigation'
+import {
+  getBlogPost,
+  getPrerenderedBlogSlugs,
+  type BlogPost,
+} from '@/lib/content'
+import {
+  generateBlogSEOMetadata,
+  generateStructuredData,
+  BlogArticleData,
+} from '@/lib/seo'
+import { Badge } from '@/components/ui/badge'
+import { Separator } from '@/components/ui/separator'
+
+// 文章页永不定时过期，内容变更时通过 webhook 按需重新生成
+export const revalidate = false
+// 未预渲染的文章在首次访问时生成并缓存
+export const dynamicParams = true
+
+const siteUrl = process.env.NEXT_PUBLIC_SITE_URL || 'http://localhost:3000'
+
+// 构建时只预渲染热门文章
+export async function generateStaticParams() {
+  const slugs = await getPrerenderedBlogSlugs()
+  return slugs.map(slug => ({ slug }))
+}
+
+function toArticleData(post: BlogPost): BlogArticleData {
+  return {
+    title: post.title,
+    description: post.description,
+    image: post.image,
+    author: post.author,
+    datePublished: post.datePublished,
+    dateModified: post.dateModified,
+    // trailingSlash 开启，canonical 与页面实际 URL 一致
+    url: `${siteUrl}/blog/${post.slug}/`,
+    keywords: post.keywords,
+    category: post.category,
+    wordCount: post.content.length,
+  }
+}
+
+export async function generateMetadata({
+  params,
+}: {
+  params: Promise<{ slug: string }>
+}): Promise<Metadata> {
+  const { slug } = await params
+  const post = await getBlogPost(slug)
+  return post ? generateBlogSEOMetadata(toArticleData(post)) : {}
+}
+
+export default async function BlogPostPage({
+  params,
+}: {
+  params: Promise<{ slug: string }>
+}) {
+  const { slug } = await params
+  const post = await getBlogPost(slug)
+  if (!post) {
+    notFound()
+  }
+
+  const structuredDataJson = generateStructuredData(
+    'article',
+    toArticleData(post)
+  )
+
+  return (
+    <article className="container mx-auto px-4 py-8 max-w-3xl">
+      <script
+        type="application/ld+json"
+        dangerouslySetInnerHTML={{ __html: structuredDataJson }}
+      />
+
+      <header className="space-y-4">
+        <h1 className="text-4xl font-bold">{post.title}</h1>
+        <p className="text-xl text-muted-foreground">{post.description}</p>
+        <div className="flex flex-wrap items-center gap-2 text-sm text-muted-foreground">
+          <span>{post.author}</span>
+          <span>{post.datePublished.slice(0, 10)}</span>
+          {post.category && (
+            <Badge variant="secondary">{post.category}</Badge>
+          )}
+          {post.keywords?.map(keyword => (
+            <Badge key={keyword} variant="outline">
+              {keyword}
+            </Badge>
+          ))}
+        </div>
+      </header>
+
+      <Separator className="my-8" />
+
+      <div className="whitespace-pre-wrap leading-7">{post.content}</div>
+    </article>
+  )
+}
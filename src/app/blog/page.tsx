@@ -0,0 +1,60 @@
+import Link from 'next/link'
+import { getRecentBlogPosts } from '@/lib/content'
+import { generateBlogListSEOMetadata } from '@/lib/seo'
+import {
+  Card,
+  CardContent,
+  CardDescription,
+  CardHeader,
+  CardTitle,
+} from '@/components/ui/card'
+import { Badge } from '@/components/ui/badge'
+
+// 列表页只在内容变更时通过 webhook 按需重新生成
+export const revalidate = false
+
+// 列表页展示的文章数量
+const BLOG_LIST_SIZE = 50
+
+export const metadata = generateBlogListSEOMetadata()
+
+export default async function BlogListPage() {
+  const posts = await getRecentBlogPosts(BLOG_LIST_SIZE)
+
+  return (
+    <div className="container mx-auto px-4 py-8 max-w-4xl">
+      <h1 className="text-4xl font-bold mb-8">博客</h1>
+
+      {posts.length === 0 ? (
+        <p className="text-muted-foreground">
+          暂无文章，在 content/blog 目录下添加 Markdown 文件即可发布。
+        </p>
+      ) : (
+        <div className="space-y-4">
+          {posts.map(post => (
+            <Card key={post.slug}>
+              <CardHeader>
+                <CardTitle>
+                  <Link
+                    href={`/blog/${post.slug}`}
+                    className="hover:underline"
+                  >
+                    {post.title}
+                  </Link>
+                </CardTitle>
+                <CardDescription>{post.description}</CardDescription>
+              </CardHeader>
+              <CardContent className="flex flex-wrap items-center gap-2 text-sm text-muted-foreground">
+                <span>{post.author}</span>
+                <span>{post.datePublished.slice(0, 10)}</span>
+                {post.category && (
+                  <Badge variant="secondary">{post.category}</Badge>
+                )}
+              </CardContent>
+            </Card>
+          ))}
+        </div>
+      )}
+    </div>
+  )
+}
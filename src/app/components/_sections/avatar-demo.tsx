@@ -0,0 +1,23 @@
+'use client'
+
+import User from 'lucide-react/icons/user'
+import { Avatar, AvatarFallback, AvatarImage } from '@/components/ui/avatar'
+
+export default function AvatarDemo() {
+  return (
+    <div className="flex gap-2">
+      <Avatar>
+        <AvatarImage src="https://github.com/shadcn.png" alt="@shadcn" />
+        <AvatarFallback>CN</AvatarFallback>
+      </Avatar>
+      <Avatar>
+        <AvatarFallback>
+          <User className="h-4 w-4" />
+        </AvatarFallback>
+      </Avatar>
+      <Avatar>
+        <AvatarFallback>用户</AvatarFallback>
+      </Avatar>
+    </div>
+  )
+}
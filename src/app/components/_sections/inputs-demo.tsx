@@ -0,0 +1,81 @@
+'use client'
+
+import { useState } from 'react'
+import {
+  Card,
+  CardContent,
+  CardDescription,
+  CardHeader,
+  CardTitle,
+} from '@/components/ui/card'
+import { Input } from '@/components/ui/input'
+import { Textarea } from '@/components/ui/textarea'
+import {
+  Select,
+  SelectContent,
+  SelectItem,
+  SelectTrigger,
+  SelectValue,
+} from '@/components/ui/select'
+import { Checkbox } from '@/components/ui/checkbox'
+import { Switch } from '@/components/ui/switch'
+
+export default function InputsDemo() {
+  const [isChecked, setIsChecked] = useState(false)
+  const [isToggled, setIsToggled] = useState(false)
+  const [selectedValue, setSelectedValue] = useState('')
+
+  return (
+    <Card>
+      <CardHeader>
+        <CardTitle>输入组件</CardTitle>
+        <CardDescription>各种输入表单元素</CardDescription>
+      </CardHeader>
+      <CardContent className="space-y-4">
+        <div className="space-y-2">
+          <label className="text-sm font-medium">文本输入：</label>
+          <Input placeholder="请输入内容..." />
+        </div>
+        <div className="space-y-2">
+          <label className="text-sm font-medium">文本域：</label>
+          <Textarea placeholder="请输入多行内容..." />
+        </div>
+        <div className="space-y-2">
+          <label className="text-sm font-medium">选择器：</label>
+          <Select value={selectedValue} onValueChange={setSelectedValue}>
+            <SelectTrigger>
+              <SelectValue placeholder="选择一个选项" />
+            </SelectTrigger>
+            <SelectContent>
+              <SelectItem value="option1">选项 1</SelectItem>
+              <SelectItem value="option2">选项 2</SelectItem>
+              <SelectItem value="option3">选项 3</SelectItem>
+            </SelectContent>
+          </Select>
+        </div>
+        <div className="flex items-center space-x-4">
+          <div className="flex items-center space-x-2">
+            <Checkbox
+              id="checkbox"
+              checked={isChecked}
+              onCheckedChange={checked => setIsChecked(checked === true)}
+            />
+            <label htmlFor="checkbox" className="text-sm font-medium">
+              复选框
+            </label>
+          </div>
+          <div className="flex items-center space-x-2">
+            <Switch
+              id="switch"
+              checked={isToggled}
+              onCheckedChange={setIsToggled}
+            />
+            <label htmlFor="switch" className="text-sm font-medium">
+              开关
+            </label>
+          </div>
+        </div>
+      </CardContent>
+    </Card>
+  )
+}
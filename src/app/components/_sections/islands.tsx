@@ -0,0 +1,42 @@
+'use client'
+
+import dynamic from 'next/dynamic'
+import { VisibleIsland } from '@/components/visible-island'
+
+// 各交互区块拆分为独立 chunk，进入视口后才下载和水合
+const InputsDemo = dynamic(() => import('./inputs-demo'), { ssr: false })
+const AvatarDemo = dynamic(() => import('./avatar-demo'), { ssr: false })
+const ProgressDemo = dynamic(() => import('./progress-demo'), { ssr: false })
+
+function Placeholder({ className }: { className: string }) {
+  return (
+    <div
+      aria-hidden="true"
+      className={`${className} rounded-xl border bg-muted/40 animate-pulse`}
+    />
+  )
+}
+
+export function InputsIsland() {
+  return (
+    <VisibleIsland fallback={<Placeholder className="h-[420px]" />}>
+      <InputsDemo />
+    </VisibleIsland>
+  )
+}
+
+export function AvatarIsland() {
+  return (
+    <VisibleIsland fallback={<Placeholder className="h-10" />}>
+      <AvatarDemo />
+    </VisibleIsland>
+  )
+}
+
+export function ProgressIsland() {
+  return (
+    <VisibleIsland fallback={<Placeholder className="h-[220px]" />}>
+      <ProgressDemo />
+    </VisibleIsland>
+  )
+}
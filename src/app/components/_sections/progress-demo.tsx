@@ -0,0 +1,50 @@
+'use client'
+
+import { useState } from 'react'
+import { Button } from '@/components/ui/button'
+import {
+  Card,
+  CardContent,
+  CardDescription,
+  CardHeader,
+  CardTitle,
+} from '@/components/ui/card'
+import { Progress } from '@/components/ui/progress'
+
+export default function ProgressDemo() {
+  const [progress, setProgress] = useState(65)
+
+  return (
+    <Card>
+      <CardHeader>
+        <CardTitle>进度条</CardTitle>
+        <CardDescription>显示任务进度</CardDescription>
+      </CardHeader>
+      <CardContent className="space-y-4">
+        <div className="space-y-2">
+          <div className="flex justify-between">
+            <span className="text-sm font-medium">当前进度</span>
+            <span className="text-sm text-muted-foreground">{progress}%</span>
+          </div>
+          <Progress value={progress} className="w-full" />
+        </div>
+        <div className="flex gap-2">
+          <Button
+            size="sm"
+            onClick={() => setProgress(Math.max(0, progress - 10))}
+            disabled={progress === 0}
+          >
+            -10
+          </Button>
+          <Button
+            size="sm"
+            onClick={() => setProgress(Math.min(100, progress + 10))}
+            disabled={progress === 100}
+          >
+            +10
+          </Button>
+        </div>
+      </CardContent>
+    </Card>
+  )
+}
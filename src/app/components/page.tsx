@@ -1,6 +1,3 @@
-'use client'
-
-import { useState } from 'react'
 import Link from 'next/link'
 import { Button } from '@/components/ui/button'
 import {
@@ -10,39 +7,22 @@ import {
   CardHeader,
   CardTitle,
 } from '@/components/ui/card'
-import { Input } from '@/components/ui/input'
-import { Textarea } from '@/components/ui/textarea'
-import {
-  Select,
-  SelectContent,
-  SelectItem,
-  SelectTrigger,
-  SelectValue,
-} from '@/components/ui/select'
-import { Checkbox } from '@/components/ui/checkbox'
-import { Switch } from '@/components/ui/switch'
 import { Badge } from '@/components/ui/badge'
 import { Alert, AlertDescription, AlertTitle } from '@/components/ui/alert'
 import { Tabs, TabsContent, TabsList, TabsTrigger } from '@/components/ui/tabs'
 import { Separator } from '@/components/ui/separator'
-import { Avatar, AvatarFallback, AvatarImage } from '@/components/ui/avatar'
-import { Progress } from '@/components/ui/progress'
-import {
-  AlertCircle,
-  CheckCircle,
-  Info,
-  Heart,
-  Star,
-  Settings,
-  User,
-} from 'lucide-react'
+// 图标逐个按模块路径引入，打包时不需要解析 lucide-react 的桶文件
+import AlertCircle from 'lucide-react/icons/circle-alert'
+import CheckCircle from 'lucide-react/icons/circle-check-big'
+import Info from 'lucide-react/icons/info'
+import Heart from 'lucide-react/icons/heart'
+import Star from 'lucide-react/icons/star'
+import Settings from 'lucide-react/icons/settings'
+import { AvatarIsland, InputsIsland, ProgressIsland } from './_sections/islands'
 
+// 服务端渲染的页面外壳：静态内容和图标直接输出 HTML，
+// 只有需要交互的区块作为客户端孤岛按需加载
 export default function ComponentsPage() {
-  const [progress, setProgress] = useState(65)
-  const [isChecked, setIsChecked] = useState(false)
-  const [isToggled, setIsToggled] = useState(false)
-  const [selectedValue, setSelectedValue] = useState('')
-
   return (
     <div className="min-h-screen bg-background p-8">
       <div className="max-w-6xl mx-auto">
@@ -130,62 +110,7 @@ export default function ComponentsPage() {
               </Card>
 
               {/* Input Components */}
-              <Card>
-                <CardHeader>
-                  <CardTitle>输入组件</CardTitle>
-                  <CardDescription>各种输入表单元素</CardDescription>
-                </CardHeader>
-                <CardContent className="space-y-4">
-                  <div className="space-y-2">
-                    <label className="text-sm font-medium">文本输入：</label>
-                    <Input placeholder="请输入内容..." />
-                  </div>
-                  <div className="space-y-2">
-                    <label className="text-sm font-medium">文本域：</label>
-                    <Textarea placeholder="请输入多行内容..." />
-                  </div>
-                  <div className="space-y-2">
-                    <label className="text-sm font-medium">选择器：</label>
-                    <Select
-                      value={selectedValue}
-                      onValueChange={setSelectedValue}
-                    >
-                      <SelectTrigger>
-                        <SelectValue placeholder="选择一个选项" />
-                      </SelectTrigger>
-                      <SelectContent>
-                        <SelectItem value="option1">选项 1</SelectItem>
-                        <SelectItem value="option2">选项 2</SelectItem>
-                        <SelectItem value="option3">选项 3</SelectItem>
-                      </SelectContent>
-                    </Select>
-                  </div>
-                  <div className="flex items-center space-x-4">
-                    <div className="flex items-center space-x-2">
-                      <Checkbox
-                        id="checkbox"
-                        checked={isChecked}
-                        onCheckedChange={checked =>
-                          setIsChecked(checked === true)
-                        }
-                      />
-                      <label htmlFor="checkbox" className="text-sm font-medium">
-                        复选框
-                      </label>
-                    </div>
-                    <div className="flex items-center space-x-2">
-                      <Switch
-                        id="switch"
-                        checked={isToggled}
-                        onCheckedChange={setIsToggled}
-                      />
-                      <label htmlFor="switch" className="text-sm font-medium">
-                        开关
-                      </label>
-                    </div>
-                  </div>
-                </CardContent>
-              </Card>
+              <InputsIsland />
             </div>
           </TabsContent>
 
@@ -201,23 +126,7 @@ export default function ComponentsPage() {
                 <CardContent className="space-y-4">
                   <div className="space-y-2">
                     <p className="text-sm font-medium">头像：</p>
-                    <div className="flex gap-2">
-                      <Avatar>
-                        <AvatarImage
-                          src="https://github.com/shadcn.png"
-                          alt="@shadcn"
-                        />
-                        <AvatarFallback>CN</AvatarFallback>
-                      </Avatar>
-                      <Avatar>
-                        <AvatarFallback>
-                          <User className="h-4 w-4" />
-                        </AvatarFallback>
-                      </Avatar>
-                      <Avatar>
-                        <AvatarFallback>用户</AvatarFallback>
-                      </Avatar>
-                    </div>
+                    <AvatarIsland />
                   </div>
                   <div className="space-y-2">
                     <p className="text-sm font-medium">徽章：</p>
@@ -232,39 +141,7 @@ export default function ComponentsPage() {
               </Card>
 
               {/* Progress */}
-              <Card>
-                <CardHeader>
-                  <CardTitle>进度条</CardTitle>
-                  <CardDescription>显示任务进度</CardDescription>
-                </CardHeader>
-                <CardContent className="space-y-4">
-                  <div className="space-y-2">
-                    <div className="flex justify-between">
-                      <span className="text-sm font-medium">当前进度</span>
-                      <span className="text-sm text-muted-foreground">
-                        {progress}%
-                      </span>
-                    </div>
-                    <Progress value={progress} className="w-full" />
-                  </div>
-                  <div className="flex gap-2">
-                    <Button
-                      size="sm"
-                      onClick={() => setProgress(Math.max(0, progress - 10))}
-                      disabled={progress === 0}
-                    >
-                      -10
-                    </Button>
-                    <Button
-                      size="sm"
-                      onClick={() => setProgress(Math.min(100, progress + 10))}
-                      disabled={progress === 100}
-                    >
-                      +10
-                    </Button>
-                  </div>
-                </CardContent>
-              </Card>
+              <ProgressIsland />
             </div>
           </TabsContent>
 
@@ -60,10 +60,28 @@ export default async function ISRDemo() {
               </ul>
             </div>
 
+            <div className="p-4 border rounded-lg">
+              <h3 className="font-semibold mb-2">按需重新验证：</h3>
+              <ul className="list-disc pl-5 space-y-1">
+                <li>博客文章页同样使用 revalidate = false</li>
+                <li>构建时只预渲染热门文章，其余首次访问时生成</li>
+                <li>
+                  内容变更后调用签名 webhook{' '}
+                  <code className="bg-muted px-1 rounded">
+                    POST /api/revalidate
+                  </code>
+                </li>
+                <li>只重新生成该文章页、所在 sitemap 分片和列表页</li>
+              </ul>
+            </div>
+
             <div className="flex gap-2">
               <Button asChild>
                 <Link href="/">返回首页</Link>
               </Button>
+              <Button variant="secondary" asChild>
+                <Link href="/blog">查看博客</Link>
+              </Button>
               <Button variant="outline" asChild>
                 <a
                   href="/isr-demo"
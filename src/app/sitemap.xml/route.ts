@@ -0,0 +1,23 @@
+import { unstable_cache } from 'next/cache'
+import { getCacheControl } from '@/lib/cache-policy'
+import { conditionalResponse, createETag } from '@/lib/http-cache'
+import { SITEMAP_INDEX_TAG, generateSitemapIndexXml } from '@/lib/sitemap'
+
+// 读取 If-None-Match 需要按请求处理；索引 XML 和 ETag 缓存在数据缓存中，一小时重新验证一次
+export const dynamic = 'force-dynamic'
+
+const getSitemapIndex = unstable_cache(
+  async () => {
+    const body = await generateSitemapIndexXml()
+    return { body, etag: createETag(body) }
+  },
+  ['sitemap-index'],
+  { revalidate: 3600, tags: [SITEMAP_INDEX_TAG] }
+)
+
+export async function GET(request: Request) {
+  return conditionalResponse(request, await getSitemapIndex(), {
+    contentType: 'application/xml; charset=utf-8',
+    cacheControl: getCacheControl('revalidate'),
+  })
+}
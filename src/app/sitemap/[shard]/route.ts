@@ -0,0 +1,38 @@
+import {
+  getSitemapShardCount,
+  getSitemapShardEntries,
+  streamSitemapXml,
+} from '@/lib/sitemap'
+
+// 每个子 sitemap 独立缓存和重新验证
+export const revalidate = 3600
+export const dynamicParams = true
+
+export async function generateStaticParams() {
+  const shardCount = await getSitemapShardCount()
+  return Array.from({ length: shardCount }, (_, shard) => ({
+    shard: `${shard}.xml`,
+  }))
+}
+
+export async function GET(
+  _request: Request,
+  { params }: { params: Promise<{ shard: string }> }
+) {
+  const { shard } = await params
+  const match = /^(\d+)\.xml$/.exec(shard)
+  if (!match) {
+    return new Response('Not Found', { status: 404 })
+  }
+
+  const shardIndex = Number(match[1])
+  if (shardIndex >= (await getSitemapShardCount())) {
+    return new Response('Not Found', { status: 404 })
+  }
+
+  return new Response(streamSitemapXml(getSitemapShardEntries(shardIndex)), {
+    headers: {
+      'Content-Type': 'application/xml; charset=utf-8',
+    },
+  })
+}
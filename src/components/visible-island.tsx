@@ -0,0 +1,46 @@
+'use client'
+
+import { useEffect, useRef, useState, type ReactNode } from 'react'
+
+interface VisibleIslandProps {
+  children: ReactNode
+  // 进入视口前显示的占位内容，应与真实内容高度接近以避免布局偏移
+  fallback: ReactNode
+  rootMargin?: string
+}
+
+// 进入视口时才渲染子组件，配合 next/dynamic 实现按需加载的客户端孤岛
+export function VisibleIsland({
+  children,
+  fallback,
+  rootMargin = '200px',
+}: VisibleIslandProps) {
+  const ref = useRef<HTMLDivElement>(null)
+  const [visible, setVisible] = useState(false)
+
+  useEffect(() => {
+    const element = ref.current
+    if (!element || visible) {
+      return
+    }
+
+    if (typeof IntersectionObserver === 'undefined') {
+      setVisible(true)
+      return
+    }
+
+    const observer = new IntersectionObserver(
+      entries => {
+        if (entries.some(entry => entry.isIntersecting)) {
+          setVisible(true)
+          observer.disconnect()
+        }
+      },
+      { rootMargin }
+    )
+    observer.observe(element)
+    return () => observer.disconnect()
+  }, [rootMargin, visible])
+
+  return <div ref={ref}>{visible ? children : fallback}</div>
+}
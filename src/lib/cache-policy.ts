@@ -0,0 +1,38 @@
+// 声明式缓存策略：路由类别 -> Cache-Control，配置见 src/config/cache-policy.json
+//
+// 该模块会被 next.config.ts 引用，只能使用相对路径导入。
+import cachePolicyConfig from '../config/cache-policy.json'
+
+export type CachePolicyName = keyof typeof cachePolicyConfig.policies
+
+export interface CacheRoute {
+  source: string
+  policy: CachePolicyName
+  // 用于校验脚本请求的示例路径
+  sample?: string
+  // 路由自行计算 ETag 并处理 If-None-Match（304）
+  conditional?: boolean
+  // Cache-Control 由 Next.js 按 revalidate 生成（ISR 页面和静态路由），这里只作为声明
+  framework?: boolean
+}
+
+export const cacheRoutes = cachePolicyConfig.routes as CacheRoute[]
+
+export function getCacheControl(policy: CachePolicyName): string {
+  return cachePolicyConfig.policies[policy]
+}
+
+// 生成 next.config.ts headers() 使用的规则；后面的规则覆盖前面的同名响应头
+export function buildCacheHeaders() {
+  return cacheRoutes
+    .filter(route => !route.framework)
+    .map(route => ({
+      source: route.source,
+      headers: [
+        {
+          key: 'Cache-Control',
+          value: getCacheControl(route.policy),
+        },
+      ],
+    }))
+}
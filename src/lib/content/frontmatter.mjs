@@ -0,0 +1,127 @@
+// 极简 frontmatter 解析器，只支持 `key: value` 和 `key: [a, b]` 两种写法，
+// 足够覆盖博客文章的元数据，避免引入额外依赖。
+// 使用 .mjs 是为了让构建脚本（scripts/build-search-index.mjs）和运行时共用同一份实现。
+
+import { promises as fs } from 'node:fs'
+
+/** @typedef {string | number | string[]} FrontmatterValue */
+
+/**
+ * @typedef {object} ParsedMarkdown
+ * @property {Record<string, FrontmatterValue>} data
+ * @property {string} body
+ */
+
+/**
+ * @typedef {object} FrontmatterFile
+ * @property {Record<string, FrontmatterValue>} data
+ * @property {Date} mtime
+ */
+
+const FRONTMATTER_PATTERN = /^---\r?\n([\s\S]*?)\r?\n---\r?\n?/
+const FRONTMATTER_START = /^---\r?\n/
+
+// 只读 frontmatter 时每次读取的字节数，通常一次就能读到结束分隔符
+const FRONTMATTER_CHUNK_SIZE = 4096
+
+/**
+ * @param {string} value
+ * @returns {string}
+ */
+function unquote(value) {
+  const quote = value[0]
+  if ((quote === '"' || quote === "'") && value.endsWith(quote)) {
+    return value.slice(1, -1)
+  }
+  return value
+}
+
+/**
+ * @param {string} raw
+ * @returns {FrontmatterValue}
+ */
+function parseValue(raw) {
+  const value = raw.trim()
+  if (value.startsWith('[') && value.endsWith(']')) {
+    return value
+      .slice(1, -1)
+      .split(',')
+      .map(item => unquote(item.trim()))
+      .filter(Boolean)
+  }
+  if (/^-?\d+(\.\d+)?$/.test(value)) {
+    return Number(value)
+  }
+  return unquote(value)
+}
+
+/**
+ * @param {string} source
+ * @returns {ParsedMarkdown}
+ */
+export function parseMarkdown(source) {
+  const match = FRONTMATTER_PATTERN.exec(source)
+  if (!match) {
+    return { data: {}, body: source }
+  }
+
+  /** @type {Record<string, FrontmatterValue>} */
+  const data = {}
+  for (const line of match[1].split(/\r?\n/)) {
+    const separator = line.indexOf(':')
+    if (separator <= 0 || line.trimStart().startsWith('#')) {
+      continue
+    }
+    data[line.slice(0, separator).trim()] = parseValue(
+      line.slice(separator + 1)
+    )
+  }
+
+  return { data, body: source.slice(match[0].length) }
+}
+
+/**
+ * 只读取文件开头的 frontmatter，读到结束分隔符即停止，不读取正文。
+ * 用于构建文章清单和搜索索引，文章数量多时避免把全部正文读入内存。
+ *
+ * @param {string} filePath
+ * @returns {Promise<FrontmatterFile>}
+ */
+export async function readFrontmatter(filePath) {
+  const handle = await fs.open(filePath, 'r')
+  try {
+    const { mtime } = await handle.stat()
+    const buffer = Buffer.alloc(FRONTMATTER_CHUNK_SIZE)
+    // 流式解码，避免多字节字符被切分在两次读取之间
+    const decoder = new TextDecoder()
+    let source = ''
+    let position = 0
+
+    for (;;) {
+      const { bytesRead } = await handle.read(
+        buffer,
+        0,
+        buffer.length,
+        position
+      )
+      if (bytesRead === 0) {
+        source += decoder.decode()
+        break
+      }
+      position += bytesRead
+      source += decoder.decode(buffer.subarray(0, bytesRead), { stream: true })
+
+      if (FRONTMATTER_PATTERN.test(source)) {
+        break
+      }
+      // 文件不以 frontmatter 开头时不再继续读取
+      if (source.length >= 5 && !FRONTMATTER_START.test(source)) {
+        return { data: {}, mtime }
+      }
+    }
+
+    return { data: parseMarkdown(source).data, mtime }
+  } finally {
+    await handle.close()
+  }
+}
@@ -0,0 +1,194 @@
+import { promises as fs, type Stats } from 'fs'
+import path from 'path'
+import { parseMarkdown, readFrontmatter } from './frontmatter.mjs'
+import { SLUG_PATTERN, toPostSummary } from './post-fields.mjs'
+import { compareByPopularity, compareByPublished } from './summary'
+import type { BlogPost, BlogPostSummary, ContentSource } from './types'
+
+// 构建清单时并发读取的文件数量
+const READ_CONCURRENCY = 64
+
+interface Manifest {
+  posts: BlogPostSummary[]
+  positions: Map<string, number>
+}
+
+function isNotFound(error: unknown): boolean {
+  return (error as NodeJS.ErrnoException).code === 'ENOENT'
+}
+
+function buildManifest(posts: BlogPostSummary[]): Manifest {
+  const sorted = [...posts].sort(compareByPublished)
+  return {
+    posts: sorted,
+    positions: new Map(sorted.map((post, i) => [post.slug, i])),
+  }
+}
+
+// 本地文件系统数据源：读取目录下的 `<slug>.md` 文件（frontmatter + Markdown 正文）
+//
+// 文章清单（不含正文）在首次访问时只读取各文件的 frontmatter 构建，并常驻进程内存，
+// 内容变更后通过 refresh(slug) 只重新读取对应文件的 frontmatter。
+//
+// 清单是进程内状态，refresh 只更新收到 webhook 的那个实例，见 ContentSource.refresh 的说明。
+export class FileSystemContentSource implements ContentSource {
+  private manifest: Promise<Manifest> | null = null
+
+  constructor(private readonly directory: string) {}
+
+  private filePath(slug: string): string {
+    return path.join(this.directory, `${slug}.md`)
+  }
+
+  private async readPost(slug: string): Promise<BlogPost | null> {
+    if (!SLUG_PATTERN.test(slug)) {
+      return null
+    }
+
+    const filePath = this.filePath(slug)
+    let file: [string, Stats]
+    try {
+      file = await Promise.all([
+        fs.readFile(filePath, 'utf8'),
+        fs.stat(filePath),
+      ])
+    } catch (error) {
+      if (isNotFound(error)) {
+        return null
+      }
+      throw error
+    }
+
+    const [source, stat] = file
+
+    const { data, body } = parseMarkdown(source)
+    return { ...toPostSummary(slug, data, stat.mtime), content: body }
+  }
+
+  // 只读取 frontmatter 构建摘要，清单和 refresh 不需要正文
+  private async readSummary(slug: string): Promise<BlogPostSummary | null> {
+    if (!SLUG_PATTERN.test(slug)) {
+      return null
+    }
+
+    try {
+      const { data, mtime } = await readFrontmatter(this.filePath(slug))
+      return toPostSummary(slug, data, mtime)
+    } catch (error) {
+      if (isNotFound(error)) {
+        return null
+      }
+      throw error
+    }
+  }
+
+  private async loadManifest(): Promise<Manifest> {
+    let files: string[]
+    try {
+      files = await fs.readdir(this.directory)
+    } catch (error) {
+      if (isNotFound(error)) {
+        return buildManifest([])
+      }
+      throw error
+    }
+
+    const slugs = files
+      .filter(file => file.endsWith('.md'))
+      .map(file => file.slice(0, -'.md'.length))
+      .filter(slug => SLUG_PATTERN.test(slug))
+
+    const posts: BlogPostSummary[] = []
+    for (let i = 0; i < slugs.length; i += READ_CONCURRENCY) {
+      const batch = await Promise.all(
+        slugs
+          .slice(i, i + READ_CONCURRENCY)
+          .map(slug => this.readSummary(slug))
+      )
+      for (const post of batch) {
+        if (post) {
+          posts.push(post)
+        }
+      }
+    }
+
+    return buildManifest(posts)
+  }
+
+  private getManifest(): Promise<Manifest> {
+    if (!this.manifest) {
+      this.manifest = this.loadManifest().catch(error => {
+        this.manifest = null
+        throw error
+      })
+    }
+    return this.manifest
+  }
+
+  refresh(slug?: string): void {
+    if (!slug || !this.manifest) {
+      this.manifest = null
+      return
+    }
+
+    // 只重新读取变更的文章，其余清单保持不变
+    const pending = Promise.all([this.manifest, this.readSummary(slug)]).then(
+      ([manifest, post]) => {
+        const index = manifest.positions.get(slug)
+        if (
+          post &&
+          index !== undefined &&
+          manifest.posts[index].datePublished === post.datePublished
+        ) {
+          manifest.posts[index] = post
+          return manifest
+        }
+
+        const others = manifest.posts.filter(item => item.slug !== slug)
+        return buildManifest(post ? [...others, post] : others)
+      }
+    )
+    pending.catch(() => {
+      if (this.manifest === pending) {
+        this.manifest = null
+      }
+    })
+    this.manifest = pending
+  }
+
+  async count(): Promise<number> {
+    return (await this.getManifest()).posts.length
+  }
+
+  async *iterate(
+    offset: number,
+    limit: number
+  ): AsyncGenerator<BlogPostSummary> {
+    const { posts } = await this.getManifest()
+    const end = Math.min(posts.length, offset + limit)
+    for (let i = offset; i < end; i++) {
+      yield posts[i]
+    }
+  }
+
+  getPost(slug: string): Promise<BlogPost | null> {
+    return this.readPost(slug)
+  }
+
+  async getPosition(slug: string): Promise<number> {
+    return (await this.getManifest()).positions.get(slug) ?? -1
+  }
+
+  async getTopPosts(limit: number): Promise<BlogPostSummary[]> {
+    const { posts } = await this.getManifest()
+    return [...posts].sort(compareByPopularity).slice(0, limit)
+  }
+
+  async getRecentPosts(limit: number): Promise<BlogPostSummary[]> {
+    if (limit <= 0) {
+      return []
+    }
+    const { posts } = await this.getManifest()
+    return posts.slice(-limit).reverse()
+  }
+}
@@ -0,0 +1,73 @@
+import path from 'path'
+import { unstable_cache } from 'next/cache'
+import { FileSystemContentSource } from './fs-source'
+import { MemoryContentSource } from './memory-source'
+import type { BlogPost, BlogPostSummary, ContentSource } from './types'
+
+export type { BlogPost, BlogPostSummary, ContentSource } from './types'
+export { FileSystemContentSource } from './fs-source'
+export { MemoryContentSource } from './memory-source'
+
+// 数据缓存标签：所有文章列表类数据
+export const BLOG_POSTS_TAG = 'blog-posts'
+
+// 构建时预渲染的热门文章数量，其余文章首次访问时再生成
+export const BLOG_PRERENDER_COUNT = Number(
+  process.env.BLOG_PRERENDER_COUNT || 100
+)
+
+// 数据缓存标签：单篇文章
+export function getBlogPostTag(slug: string): string {
+  return `blog-post:${slug}`
+}
+
+function createDefaultContentSource(): ContentSource {
+  if (process.env.CONTENT_SOURCE === 'memory') {
+    return new MemoryContentSource()
+  }
+
+  return new FileSystemContentSource(
+    process.env.BLOG_CONTENT_DIR || path.join(process.cwd(), 'content', 'blog')
+  )
+}
+
+let contentSource: ContentSource | null = null
+
+// 获取当前博客数据源，默认读取 content/blog 目录，CONTENT_SOURCE=memory 时使用内存数据源
+export function getContentSource(): ContentSource {
+  if (!contentSource) {
+    contentSource = createDefaultContentSource()
+  }
+  return contentSource
+}
+
+// 替换博客数据源（CMS、数据库或测试用的内存数据源）
+export function setContentSource(source: ContentSource) {
+  contentSource = source
+}
+
+// 获取单篇文章，结果按文章标签缓存，可通过 revalidateTag 单独失效
+export function getBlogPost(slug: string): Promise<BlogPost | null> {
+  return unstable_cache(
+    () => getContentSource().getPost(slug),
+    ['blog-post', slug],
+    { tags: [getBlogPostTag(slug)] }
+  )()
+}
+
+// 获取最新文章列表
+export function getRecentBlogPosts(
+  limit: number
+): Promise<BlogPostSummary[]> {
+  return unstable_cache(
+    () => getContentSource().getRecentPosts(limit),
+    ['blog-posts-recent', String(limit)],
+    { tags: [BLOG_POSTS_TAG] }
+  )()
+}
+
+// 构建时预渲染的文章 slug
+export async function getPrerenderedBlogSlugs(): Promise<string[]> {
+  const posts = await getContentSource().getTopPosts(BLOG_PRERENDER_COUNT)
+  return posts.map(post => post.slug)
+}
@@ -0,0 +1,75 @@
+import { compareByPopularity, compareByPublished, toSummary } from './summary'
+import type { BlogPost, BlogPostSummary, ContentSource } from './types'
+
+// 内存数据源，适用于测试和演示
+export class MemoryContentSource implements ContentSource {
+  private posts: BlogPost[] = []
+  private positions = new Map<string, number>()
+
+  constructor(posts: BlogPost[] = []) {
+    this.replaceAll(posts)
+  }
+
+  replaceAll(posts: BlogPost[]): void {
+    this.posts = [...posts].sort(compareByPublished)
+    this.positions = new Map(this.posts.map((post, i) => [post.slug, i]))
+  }
+
+  upsert(post: BlogPost): void {
+    const index = this.positions.get(post.slug)
+    if (
+      index !== undefined &&
+      this.posts[index].datePublished === post.datePublished
+    ) {
+      this.posts[index] = post
+      return
+    }
+
+    // 新文章或发布时间变化时重新排序，保持 iterate 的发布时间顺序
+    this.replaceAll([
+      ...this.posts.filter(item => item.slug !== post.slug),
+      post,
+    ])
+  }
+
+  remove(slug: string): void {
+    this.replaceAll(this.posts.filter(post => post.slug !== slug))
+  }
+
+  async count(): Promise<number> {
+    return this.posts.length
+  }
+
+  async *iterate(
+    offset: number,
+    limit: number
+  ): AsyncGenerator<BlogPostSummary> {
+    const end = Math.min(this.posts.length, offset + limit)
+    for (let i = offset; i < end; i++) {
+      yield toSummary(this.posts[i])
+    }
+  }
+
+  async getPost(slug: string): Promise<BlogPost | null> {
+    const index = this.positions.get(slug)
+    return index === undefined ? null : this.posts[index]
+  }
+
+  async getPosition(slug: string): Promise<number> {
+    return this.positions.get(slug) ?? -1
+  }
+
+  async getTopPosts(limit: number): Promise<BlogPostSummary[]> {
+    return this.posts
+      .map(toSummary)
+      .sort(compareByPopularity)
+      .slice(0, limit)
+  }
+
+  async getRecentPosts(limit: number): Promise<BlogPostSummary[]> {
+    if (limit <= 0) {
+      return []
+    }
+    return this.posts.slice(-limit).reverse().map(toSummary)
+  }
+}
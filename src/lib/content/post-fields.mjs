@@ -0,0 +1,51 @@
+// frontmatter 到文章字段的映射，文件系统数据源（fs-source.ts）和
+// 搜索索引构建脚本（scripts/build-search-index.mjs）共用，保证两边对同一篇文章的解析一致。
+
+/** @typedef {import('./frontmatter.mjs').FrontmatterValue} FrontmatterValue */
+/** @typedef {import('./types').BlogPostSummary} BlogPostSummary */
+
+// 合法的文章 slug，同时也是 content 目录下的文件名（不含 .md）
+export const SLUG_PATTERN = /^[a-zA-Z0-9_-]+$/
+
+/**
+ * @param {FrontmatterValue | undefined} value
+ * @returns {string | undefined}
+ */
+function asString(value) {
+  return typeof value === 'string' ? value : undefined
+}
+
+/**
+ * @param {FrontmatterValue | undefined} value
+ * @returns {string[] | undefined}
+ */
+function asStringArray(value) {
+  if (Array.isArray(value)) {
+    return value
+  }
+  return typeof value === 'string' ? [value] : undefined
+}
+
+/**
+ * 由 frontmatter 得到文章摘要，缺省的时间使用文件修改时间，保证 lastModified 稳定
+ *
+ * @param {string} slug
+ * @param {Record<string, FrontmatterValue>} data
+ * @param {Date} mtime
+ * @returns {BlogPostSummary}
+ */
+export function toPostSummary(slug, data, mtime) {
+  return {
+    slug,
+    title: asString(data.title) || slug,
+    description: asString(data.description) || '',
+    author: asString(data.author) || '',
+    datePublished: asString(data.datePublished) || mtime.toISOString(),
+    dateModified: asString(data.dateModified) || mtime.toISOString(),
+    image: asString(data.image),
+    keywords: asStringArray(data.keywords),
+    category: asString(data.category),
+    popularity:
+      typeof data.popularity === 'number' ? data.popularity : undefined,
+  }
+}
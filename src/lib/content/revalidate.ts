@@ -0,0 +1,69 @@
+import { createHmac, timingSafeEqual } from 'crypto'
+import { revalidatePath, revalidateTag } from 'next/cache'
+import {
+  SITEMAP_INDEX_TAG,
+  getSitemapShardCount,
+  getSitemapShardForPosition,
+} from '@/lib/sitemap'
+import { BLOG_POSTS_TAG, getBlogPostTag, getContentSource } from './index'
+
+// webhook 签名请求头，格式与 GitHub 相同：`sha256=<hex>`
+export const REVALIDATE_SIGNATURE_HEADER = 'x-revalidate-signature'
+
+export function createWebhookSignature(body: string, secret: string): string {
+  return `sha256=${createHmac('sha256', secret).update(body).digest('hex')}`
+}
+
+export function verifyWebhookSignature(
+  body: string,
+  signature: string | null,
+  secret: string
+): boolean {
+  if (!signature) {
+    return false
+  }
+
+  const expected = Buffer.from(createWebhookSignature(body, secret))
+  const actual = Buffer.from(signature)
+  return expected.length === actual.length && timingSafeEqual(expected, actual)
+}
+
+// 单篇文章变更后，只失效该文章页面、所在的 sitemap 分片和列表页
+export async function revalidateBlogPost(slug: string): Promise<string[]> {
+  const source = getContentSource()
+  const previousPosition = await source.getPosition(slug)
+  const previousShardCount = await getSitemapShardCount()
+  source.refresh?.(slug)
+  const position = await source.getPosition(slug)
+
+  revalidateTag(getBlogPostTag(slug))
+  revalidateTag(BLOG_POSTS_TAG)
+
+  const paths = [`/blog/${slug}`, '/blog']
+
+  const positions = [previousPosition, position].filter(value => value >= 0)
+  if (positions.length > 0) {
+    const firstShard = getSitemapShardForPosition(Math.min(...positions))
+    let lastShard = getSitemapShardForPosition(Math.max(...positions))
+
+    // 新增或删除文章会让其后的文章整体移动，后续分片和索引都需要更新；
+    // 删除文章可能让最后一个分片消失，按变更前后较大的分片数重新验证，旧分片才会变为 404
+    if (previousPosition !== position) {
+      const shardCount = Math.max(
+        previousShardCount,
+        await getSitemapShardCount()
+      )
+      lastShard = shardCount - 1
+      revalidateTag(SITEMAP_INDEX_TAG)
+    }
+
+    for (let shard = firstShard; shard <= lastShard; shard++) {
+      paths.push(`/sitemap/${shard}.xml`)
+    }
+  }
+
+  for (const path of paths) {
+    revalidatePath(path)
+  }
+  return paths
+}
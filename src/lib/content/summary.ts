@@ -0,0 +1,28 @@
+import type { BlogPost, BlogPostSummary } from './types'
+
+export function toSummary(post: BlogPost): BlogPostSummary {
+  // eslint-disable-next-line @typescript-eslint/no-unused-vars
+  const { content, ...summary } = post
+  return summary
+}
+
+// iterate 使用的稳定顺序：发布时间升序，同一时间按 slug 排序
+export function compareByPublished(
+  a: BlogPostSummary,
+  b: BlogPostSummary
+): number {
+  return (
+    a.datePublished.localeCompare(b.datePublished) ||
+    a.slug.localeCompare(b.slug)
+  )
+}
+
+export function compareByPopularity(
+  a: BlogPostSummary,
+  b: BlogPostSummary
+): number {
+  return (
+    (b.popularity ?? 0) - (a.popularity ?? 0) ||
+    b.datePublished.localeCompare(a.datePublished)
+  )
+}
@@ -0,0 +1,41 @@
+// 博客文章
+export interface BlogPost {
+  slug: string
+  title: string
+  description: string
+  content: string
+  author: string
+  // ISO 8601 时间字符串，便于在数据缓存中序列化
+  datePublished: string
+  dateModified?: string
+  image?: string
+  keywords?: string[]
+  category?: string
+  // 热度分值，用于决定构建时预渲染哪些文章
+  popularity?: number
+}
+
+// 列表和 sitemap 只需要的文章摘要，不包含正文
+export type BlogPostSummary = Omit<BlogPost, 'content'>
+
+// 博客内容数据源
+//
+// iterate 的顺序必须稳定（按发布时间升序），新文章追加在末尾，
+// 这样已有文章所在的 sitemap 分片不会因为新增文章而变化。
+export interface ContentSource {
+  count(): Promise<number>
+  iterate(offset: number, limit: number): AsyncIterable<BlogPostSummary>
+  getPost(slug: string): Promise<BlogPost | null>
+  // 文章在 iterate 顺序中的位置，不存在时返回 -1
+  getPosition(slug: string): Promise<number>
+  // 按热度降序返回前 N 篇文章
+  getTopPosts(limit: number): Promise<BlogPostSummary[]>
+  // 按发布时间降序返回最新的 N 篇文章
+  getRecentPosts(limit: number): Promise<BlogPostSummary[]>
+  // 丢弃进程内缓存的索引，内容变更后由 webhook 调用
+  //
+  // 假设单实例部署：refresh 只作用于处理 webhook 请求的进程。
+  // 多实例部署时其余实例的索引会一直停留在旧状态（直到重启），
+  // 需要把 webhook 广播到每个实例，或改用各实例共享的数据源。
+  refresh?(slug?: string): void
+}
@@ -0,0 +1,47 @@
+import { createHash } from 'crypto'
+
+// 基于内容的弱 ETag
+export function createETag(body: string): string {
+  return `W/"${createHash('sha1').update(body).digest('base64url')}"`
+}
+
+// If-None-Match 是否命中当前 ETag（弱比较）
+export function isNotModified(request: Request, etag: string): boolean {
+  const header = request.headers.get('if-none-match')
+  if (!header) {
+    return false
+  }
+  if (header.trim() === '*') {
+    return true
+  }
+
+  const opaque = etag.replace(/^W\//, '')
+  return header
+    .split(',')
+    .some(candidate => candidate.trim().replace(/^W\//, '') === opaque)
+}
+
+export interface CachedBody {
+  body: string
+  etag: string
+}
+
+// 返回带 ETag 的文本响应，客户端缓存仍有效时返回 304
+export function conditionalResponse(
+  request: Request,
+  { body, etag }: CachedBody,
+  headers: { contentType: string; cacheControl: string }
+): Response {
+  const responseHeaders = {
+    'Cache-Control': headers.cacheControl,
+    ETag: etag,
+  }
+
+  if (isNotModified(request, etag)) {
+    return new Response(null, { status: 304, headers: responseHeaders })
+  }
+
+  return new Response(body, {
+    headers: { ...responseHeaders, 'Content-Type': headers.contentType },
+  })
+}
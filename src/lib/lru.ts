@@ -0,0 +1,44 @@
+// 基于 Map 插入顺序实现的简单 LRU 缓存
+export class LRUCache<K, V> {
+  private readonly entries = new Map<K, V>()
+
+  constructor(private readonly maxSize: number) {
+    if (maxSize < 1) {
+      throw new Error('LRUCache maxSize must be at least 1')
+    }
+  }
+
+  get size(): number {
+    return this.entries.size
+  }
+
+  get(key: K): V | undefined {
+    const value = this.entries.get(key)
+    if (value === undefined) {
+      return undefined
+    }
+
+    // 重新插入，标记为最近使用
+    this.entries.delete(key)
+    this.entries.set(key, value)
+    return value
+  }
+
+  set(key: K, value: V): void {
+    if (this.entries.has(key)) {
+      this.entries.delete(key)
+    } else if (this.entries.size >= this.maxSize) {
+      const oldestKey = this.entries.keys().next().value as K
+      this.entries.delete(oldestKey)
+    }
+    this.entries.set(key, value)
+  }
+
+  delete(key: K): boolean {
+    return this.entries.delete(key)
+  }
+
+  clear(): void {
+    this.entries.clear()
+  }
+}
@@ -0,0 +1,509 @@
+// 博客全文检索核心：CJK 感知的分词、倒排索引的构建/序列化和查询。
+// 使用 .mjs 是为了让构建脚本（scripts/build-search-index.mjs）和运行时共用同一份实现，
+// 保证建索引和查询时的分词完全一致。
+
+/**
+ * @typedef {object} SearchDocument
+ * @property {string} slug
+ * @property {string} title
+ * @property {string} description
+ * @property {string[]} [keywords]
+ * @property {string} [category]
+ */
+
+/**
+ * 构建阶段的索引数据
+ * - docs: [slug, title, description, category]
+ * - terms: 按字典序排列的词项
+ * - postings: 与 terms 一一对应，[docId, 权重, docId, 权重, ...]，docId 递增
+ *
+ * @typedef {object} SearchIndexData
+ * @property {Array<[string, string, string, string]>} docs
+ * @property {string[]} terms
+ * @property {number[][]} postings
+ */
+
+/**
+ * @typedef {object} SearchResult
+ * @property {string} slug
+ * @property {string} title
+ * @property {string} description
+ * @property {string} category
+ * @property {number} score
+ */
+
+export const SEARCH_INDEX_VERSION = 1
+
+// 序列化文件头：魔数 + 头部 JSON 长度
+const MAGIC = 0x31495342 // 'BSI1'
+
+// 字段权重：词项在某个字段中每出现一次累加对应权重，单篇文档内的累计权重上限为 MAX_WEIGHT（255）
+const FIELD_WEIGHTS = {
+  title: 6,
+  keywords: 4,
+  category: 3,
+  description: 2,
+}
+
+// 前缀匹配最多展开的词项数量
+const MAX_PREFIX_EXPANSIONS = 64
+
+// 词频饱和参数
+const SATURATION = 4
+const MAX_WEIGHT = 255
+
+// 中日韩文字：汉字、假名、谚文
+const CJK_RUN = '[\\u3040-\\u30ff\\u3400-\\u4dbf\\u4e00-\\u9fff\\uf900-\\ufaff\\uac00-\\ud7af]+'
+const TOKEN_PATTERN = new RegExp(`(${CJK_RUN})|([\\p{L}\\p{N}]+)`, 'gu')
+
+/**
+ * @param {string} text
+ * @returns {string}
+ */
+function normalize(text) {
+  return text.normalize('NFKC').toLowerCase()
+}
+
+/**
+ * @param {string} run
+ * @returns {string[]}
+ */
+function cjkBigrams(run) {
+  const chars = Array.from(run)
+  if (chars.length === 1) {
+    return chars
+  }
+  const bigrams = []
+  for (let i = 0; i < chars.length - 1; i++) {
+    bigrams.push(chars[i] + chars[i + 1])
+  }
+  return bigrams
+}
+
+/**
+ * 建索引用的分词：拉丁文按单词切分；中日韩文字同时输出单字和二元组，
+ * 这样单字查询和词语查询都能命中，无需词典分词。
+ *
+ * @param {string} text
+ * @returns {string[]}
+ */
+export function tokenize(text) {
+  const tokens = []
+  for (const match of normalize(text).matchAll(TOKEN_PATTERN)) {
+    if (match[1]) {
+      const chars = Array.from(match[1])
+      tokens.push(...chars)
+      if (chars.length > 1) {
+        tokens.push(...cjkBigrams(match[1]))
+      }
+    } else {
+      tokens.push(match[2])
+    }
+  }
+  return tokens
+}
+
+/**
+ * 查询分词：中日韩文字只使用二元组（单字时用单字）以提高准确率；
+ * 查询末尾未以空白结束的拉丁单词作为前缀匹配。
+ *
+ * @param {string} query
+ * @returns {{ terms: string[], prefix: string | null }}
+ */
+export function tokenizeQuery(query) {
+  /** @type {string[]} */
+  const terms = []
+  /** @type {string | null} */
+  let prefix = null
+  const normalized = normalize(query)
+  const matches = Array.from(normalized.matchAll(TOKEN_PATTERN))
+
+  matches.forEach((match, i) => {
+    if (match[1]) {
+      terms.push(...cjkBigrams(match[1]))
+      return
+    }
+
+    const isLast = i === matches.length - 1
+    const endsQuery =
+      (match.index ?? 0) + match[0].length === normalized.length
+    if (isLast && endsQuery) {
+      prefix = match[2]
+    } else {
+      terms.push(match[2])
+    }
+  })
+
+  return { terms: [...new Set(terms)], prefix }
+}
+
+/**
+ * 构建倒排索引
+ *
+ * @param {Iterable<SearchDocument>} documents
+ * @returns {SearchIndexData}
+ */
+export function buildSearchIndex(documents) {
+  /** @type {SearchIndexData['docs']} */
+  const docs = []
+  /** @type {Map<string, Map<number, number>>} */
+  const postingsByTerm = new Map()
+
+  /**
+   * @param {number} docId
+   * @param {string} text
+   * @param {number} weight
+   */
+  function addField(docId, text, weight) {
+    for (const token of tokenize(text)) {
+      let postings = postingsByTerm.get(token)
+      if (!postings) {
+        postings = new Map()
+        postingsByTerm.set(token, postings)
+      }
+      postings.set(docId, (postings.get(docId) ?? 0) + weight)
+    }
+  }
+
+  for (const doc of documents) {
+    const docId = docs.length
+    docs.push([doc.slug, doc.title, doc.description, doc.category ?? ''])
+    addField(docId, doc.title, FIELD_WEIGHTS.title)
+    addField(docId, doc.description, FIELD_WEIGHTS.description)
+    addField(docId, (doc.keywords ?? []).join(' '), FIELD_WEIGHTS.keywords)
+    addField(docId, doc.category ?? '', FIELD_WEIGHTS.category)
+  }
+
+  const terms = Array.from(postingsByTerm.keys()).sort()
+  const postings = terms.map(term => {
+    /** @type {number[]} */
+    const flat = []
+    // 文档按 docId 递增加入，Map 的插入顺序即为有序
+    for (const [docId, weight] of /** @type {Map<number, number>} */ (
+      postingsByTerm.get(term)
+    )) {
+      flat.push(docId, Math.min(weight, MAX_WEIGHT))
+    }
+    return flat
+  })
+
+  return { docs, terms, postings }
+}
+
+/**
+ * 序列化为紧凑的二进制格式：
+ * [魔数 u32][头部长度 u32][头部 JSON: version, docs, terms]
+ * [每个词项：文档数 varint，随后是 (docId 增量 varint, 权重 u8) 序列]
+ *
+ * @param {SearchIndexData} data
+ * @returns {Uint8Array}
+ */
+export function serializeSearchIndex(data) {
+  const header = new TextEncoder().encode(
+    JSON.stringify({
+      version: SEARCH_INDEX_VERSION,
+      docs: data.docs,
+      terms: data.terms,
+    })
+  )
+
+  /** @type {number[]} */
+  const body = []
+  /** @param {number} value */
+  function writeVarint(value) {
+    while (value >= 0x80) {
+      body.push((value & 0x7f) | 0x80)
+      value >>>= 7
+    }
+    body.push(value)
+  }
+
+  for (const postings of data.postings) {
+    writeVarint(postings.length / 2)
+    let previous = 0
+    for (let i = 0; i < postings.length; i += 2) {
+      writeVarint(postings[i] - previous)
+      body.push(postings[i + 1])
+      previous = postings[i]
+    }
+  }
+
+  const output = new Uint8Array(8 + header.length + body.length)
+  const view = new DataView(output.buffer)
+  view.setUint32(0, MAGIC, true)
+  view.setUint32(4, header.length, true)
+  output.set(header, 8)
+  output.set(body, 8 + header.length)
+  return output
+}
+
+/**
+ * 排好序的数组中第一个 >= value 的位置
+ *
+ * @param {string[]} sorted
+ * @param {string} value
+ * @returns {number}
+ */
+function lowerBound(sorted, value) {
+  let low = 0
+  let high = sorted.length
+  while (low < high) {
+    const mid = (low + high) >>> 1
+    if (sorted[mid] < value) {
+      low = mid + 1
+    } else {
+      high = mid
+    }
+  }
+  return low
+}
+
+// 加载后的只读索引，每个进程只需要加载一次。
+// 倒排表解码为扁平的类型化数组，查询时复用打分缓冲区，避免为每次查询分配内存。
+export class SearchIndex {
+  /**
+   * @param {Uint8Array} buffer serializeSearchIndex 的输出
+   * @returns {SearchIndex}
+   */
+  static deserialize(buffer) {
+    const view = new DataView(buffer.buffer, buffer.byteOffset, buffer.length)
+    if (buffer.length < 8 || view.getUint32(0, true) !== MAGIC) {
+      throw new Error('Invalid search index file, rebuild the index')
+    }
+
+    const headerLength = view.getUint32(4, true)
+    const header = JSON.parse(
+      new TextDecoder().decode(buffer.subarray(8, 8 + headerLength))
+    )
+    if (header.version !== SEARCH_INDEX_VERSION) {
+      throw new Error(
+        `Unsupported search index version ${header.version}, rebuild the index`
+      )
+    }
+
+    /** @type {string[]} */
+    const terms = header.terms
+    const offsets = new Int32Array(terms.length + 1)
+    // 先按文件长度预估容量，解码完成后截断
+    let docIds = new Int32Array(buffer.length)
+    let weights = new Uint8Array(buffer.length)
+    let position = 8 + headerLength
+    let count = 0
+
+    function readVarint() {
+      let value = 0
+      let shift = 0
+      let byte
+      do {
+        byte = buffer[position++]
+        value |= (byte & 0x7f) << shift
+        shift += 7
+      } while (byte & 0x80)
+      return value >>> 0
+    }
+
+    for (let termId = 0; termId < terms.length; termId++) {
+      offsets[termId] = count
+      const length = readVarint()
+      let docId = 0
+      for (let i = 0; i < length; i++) {
+        docId += readVarint()
+        docIds[count] = docId
+        weights[count] = buffer[position++]
+        count++
+      }
+    }
+    offsets[terms.length] = count
+    docIds = docIds.slice(0, count)
+    weights = weights.slice(0, count)
+
+    return new SearchIndex(header.docs, terms, offsets, docIds, weights)
+  }
+
+  /**
+   * @param {SearchIndexData} data
+   * @returns {SearchIndex}
+   */
+  static fromData(data) {
+    return SearchIndex.deserialize(serializeSearchIndex(data))
+  }
+
+  /**
+   * @param {SearchIndexData['docs']} docs
+   * @param {string[]} terms
+   * @param {Int32Array} offsets
+   * @param {Int32Array} docIds
+   * @param {Uint8Array} weights
+   */
+  constructor(docs, terms, offsets, docIds, weights) {
+    this.docs = docs
+    this.terms = terms
+    this.offsets = offsets
+    this.docIds = docIds
+    this.weights = weights
+    /** @type {Map<string, number>} */
+    this.termIds = new Map(terms.map((term, i) => [term, i]))
+
+    const size = docs.length
+    // 查询时复用的缓冲区（Node.js 单线程，同步查询之间不会并发）
+    this.scores = new Float64Array(size)
+    this.groupScores = new Float64Array(size)
+    this.matchedGroups = new Uint8Array(size)
+    this.touched = new Int32Array(size)
+    this.groupTouched = new Int32Array(size)
+
+    this.saturation = new Float64Array(MAX_WEIGHT + 1)
+    for (let weight = 0; weight <= MAX_WEIGHT; weight++) {
+      this.saturation[weight] = weight / (weight + SATURATION)
+    }
+  }
+
+  get size() {
+    return this.docs.length
+  }
+
+  /**
+   * @param {number} termId
+   * @returns {number}
+   */
+  idf(termId) {
+    const df = this.offsets[termId + 1] - this.offsets[termId]
+    return Math.log(1 + (this.docs.length - df + 0.5) / (df + 0.5))
+  }
+
+  /**
+   * 把一组词项（一个查询词或其前缀展开）的得分累加到 scores，同一组内每篇文档取最高分
+   *
+   * @param {number[]} termIds
+   * @param {number} touchedCount
+   * @returns {number} 新的 touchedCount
+   */
+  scoreGroup(termIds, touchedCount) {
+    const { docIds, weights, saturation, scores, groupScores, matchedGroups } =
+      this
+    const touched = this.touched
+    const groupTouched = this.groupTouched
+    let groupCount = 0
+
+    for (const termId of termIds) {
+      const idf = this.idf(termId)
+      const end = this.offsets[termId + 1]
+      for (let i = this.offsets[termId]; i < end; i++) {
+        const docId = docIds[i]
+        const score = idf * saturation[weights[i]]
+        if (groupScores[docId] === 0) {
+          groupTouched[groupCount++] = docId
+        }
+        if (score > groupScores[docId]) {
+          groupScores[docId] = score
+        }
+      }
+    }
+
+    for (let i = 0; i < groupCount; i++) {
+      const docId = groupTouched[i]
+      if (matchedGroups[docId] === 0) {
+        touched[touchedCount++] = docId
+      }
+      scores[docId] += groupScores[docId]
+      matchedGroups[docId]++
+      groupScores[docId] = 0
+    }
+    return touchedCount
+  }
+
+  /**
+   * @param {string} prefix
+   * @returns {number[]}
+   */
+  expandPrefix(prefix) {
+    const termIds = []
+    for (
+      let i = lowerBound(this.terms, prefix);
+      i < this.terms.length &&
+      this.terms[i].startsWith(prefix) &&
+      termIds.length < MAX_PREFIX_EXPANSIONS;
+      i++
+    ) {
+      termIds.push(i)
+    }
+    return termIds
+  }
+
+  /**
+   * 查询：命中查询词越多的文档排名越前，其次按得分排序
+   *
+   * @param {string} query
+   * @param {number} [limit]
+   * @returns {SearchResult[]}
+   */
+  search(query, limit = 10) {
+    const { terms, prefix } = tokenizeQuery(query)
+    /** @type {number[][]} */
+    const groups = []
+    for (const term of terms) {
+      const termId = this.termIds.get(term)
+      if (termId !== undefined) {
+        groups.push([termId])
+      }
+    }
+    if (prefix) {
+      const expanded = this.expandPrefix(prefix)
+      if (expanded.length > 0) {
+        groups.push(expanded)
+      }
+    }
+    if (groups.length === 0 || limit <= 0) {
+      return []
+    }
+
+    let touchedCount = 0
+    for (const group of groups) {
+      touchedCount = this.scoreGroup(group, touchedCount)
+    }
+
+    // 只保留前 limit 名：按命中分组数、得分、docId 排序的插入选择
+    const { scores, matchedGroups, touched } = this
+    /** @type {number[]} */
+    const top = []
+    /**
+     * @param {number} a
+     * @param {number} b
+     */
+    const before = (a, b) =>
+      matchedGroups[a] > matchedGroups[b] ||
+      (matchedGroups[a] === matchedGroups[b] &&
+        (scores[a] > scores[b] || (scores[a] === scores[b] && a < b)))
+
+    for (let i = 0; i < touchedCount; i++) {
+      const docId = touched[i]
+      if (top.length === limit && !before(docId, top[limit - 1])) {
+        continue
+      }
+      let j = top.length < limit ? top.length : limit - 1
+      while (j > 0 && before(docId, top[j - 1])) {
+        top[j] = top[j - 1]
+        j--
+      }
+      top[j] = docId
+    }
+
+    const results = top.map(docId => {
+      const [slug, title, description, category] = this.docs[docId]
+      return {
+        slug,
+        title,
+        description,
+        category,
+        score: Math.round(scores[docId] * 1000) / 1000,
+      }
+    })
+
+    // 重置本次查询用到的缓冲区
+    for (let i = 0; i < touchedCount; i++) {
+      scores[touched[i]] = 0
+      matchedGroups[touched[i]] = 0
+    }
+    return results
+  }
+}
@@ -0,0 +1,36 @@
+import { readFileSync } from 'fs'
+import path from 'path'
+import { SearchIndex, type SearchResult } from './core.mjs'
+
+export type { SearchResult } from './core.mjs'
+
+// 单次查询最多返回的结果数
+export const SEARCH_MAX_LIMIT = 50
+
+// 构建时生成的索引文件，可通过 SEARCH_INDEX_FILE 覆盖
+function getIndexFile(): string {
+  return (
+    process.env.SEARCH_INDEX_FILE ||
+    path.join(process.cwd(), 'src', 'generated', 'search-index.bin')
+  )
+}
+
+let searchIndex: SearchIndex | null = null
+
+// 索引在首次查询时加载并常驻进程内存。
+// 索引只在构建时生成，webhook 按需重新验证的文章要到下次构建后才能被搜索到
+export function getSearchIndex(): SearchIndex {
+  if (!searchIndex) {
+    searchIndex = SearchIndex.deserialize(readFileSync(getIndexFile()))
+  }
+  return searchIndex
+}
+
+// 搜索博客文章（标题、描述、关键词、分类），支持中文和末尾单词的前缀匹配
+export function searchPosts(query: string, limit = 10): SearchResult[] {
+  const normalizedLimit = Math.min(
+    Math.max(Math.floor(limit) || 1, 1),
+    SEARCH_MAX_LIMIT
+  )
+  return getSearchIndex().search(query, normalizedLimit)
+}
@@ -1,5 +1,7 @@
 import { Metadata } from 'next'
-import seoConfig from '@/config/seo.json'
+import rawSeoConfig from '@/config/seo.json'
+import seoArtifacts from '@/generated/seo-artifacts.json'
+import { LRUCache } from '@/lib/lru'
 
 export interface SEOConfig {
   title?: string
@@ -27,6 +29,40 @@ export interface SEOConfig {
   structuredData?: Record<string, unknown>
 }
 
+interface StructuredDataNode {
+  '@context': string
+  '@type': string
+  [key: string]: unknown
+}
+
+// src/config/seo.json 的结构，构建时由 src/config/seo.schema.json 校验
+export interface SiteSEOConfig {
+  blog: Required<
+    Pick<SEOConfig, 'title' | 'description' | 'keywords' | 'author'>
+  > & {
+    siteUrl: string
+    openGraph: NonNullable<SEOConfig['openGraph']>
+    twitter: NonNullable<SEOConfig['twitter']>
+    structuredData: {
+      website: StructuredDataNode
+      organization: StructuredDataNode & { logo: { url: string } }
+      blog: StructuredDataNode
+      article: StructuredDataNode
+    }
+  }
+  defaults: SEOConfig
+  robots: {
+    rules: Array<{
+      userAgent: string[]
+      allow?: string[]
+      disallow?: string[]
+      crawlDelay?: number
+    }>
+  }
+}
+
+const seoConfig: SiteSEOConfig = rawSeoConfig
+
 export interface BlogArticleData {
   title: string
   description: string
@@ -40,47 +76,142 @@ export interface BlogArticleData {
   wordCount?: number
 }
 
+// 结构化数据在生产环境输出紧凑 JSON，开发环境保持缩进便于阅读
+const prettyStructuredData = process.env.NODE_ENV !== 'production'
+
+// 文章级结果的缓存容量
+const ARTICLE_CACHE_SIZE = 500
+
+function deepFreeze<T>(value: T): T {
+  if (value && typeof value === 'object' && !Object.isFrozen(value)) {
+    Object.freeze(value)
+    for (const child of Object.values(value)) {
+      deepFreeze(child)
+    }
+  }
+  return value
+}
+
+// seo.json 中的默认配置只解析一次，之后所有调用共享同一份冻结对象
+const resolvedDefaults: SEOConfig = deepFreeze(
+  structuredClone(seoConfig.defaults)
+)
+
+const blogOpenGraph: NonNullable<SEOConfig['openGraph']> = deepFreeze({
+  ...structuredClone(seoConfig.blog.openGraph),
+  type: 'article',
+})
+
+// 结构化数据通过 dangerouslySetInnerHTML 写入 <script>，文章字段来自可替换的数据源，
+// 转义 < 防止内容中的 </script> 提前结束标签；U+2028 / U+2029 一并转义。
+// 与 scripts/build-seo.mjs 的 escapeJsonForHtml 保持一致
+function escapeJsonForHtml(json: string): string {
+  return json
+    .replace(/</g, '\\u003c')
+    .replace(/\u2028/g, '\\u2028')
+    .replace(/\u2029/g, '\\u2029')
+}
+
+// 作为数组元素的结构化数据片段，与 JSON.stringify(array, null, 2) 的缩进保持一致
+function serializeFragment(value: unknown): string {
+  return escapeJsonForHtml(
+    prettyStructuredData
+      ? JSON.stringify(value, null, 2).replace(/\n/g, '\n  ')
+      : JSON.stringify(value)
+  )
+}
+
+function spliceFragments(fragments: string[]): string {
+  return prettyStructuredData
+    ? `[\n  ${fragments.join(',\n  ')}\n]`
+    : `[${fragments.join(',')}]`
+}
+
+const structuredDataTemplates = seoConfig.blog.structuredData
+
+// 构建时预序列化的静态结构化数据片段（scripts/build-seo.mjs）
+const serializedNodes = seoArtifacts.structuredData
+const sharedFragments = prettyStructuredData
+  ? serializedNodes.prettyFragment
+  : serializedNodes.compact
+
+const structuredDataFragments = deepFreeze({
+  website: prettyStructuredData
+    ? serializedNodes.pretty.website
+    : serializedNodes.compact.website,
+  sharedNodes: [
+    sharedFragments.website,
+    sharedFragments.organization,
+    sharedFragments.blog,
+  ],
+})
+
+const blogStructuredDataJson = spliceFragments(
+  structuredDataFragments.sharedNodes
+)
+
+const articleMetadataCache = new LRUCache<string, Metadata>(ARTICLE_CACHE_SIZE)
+const articleStructuredDataCache = new LRUCache<string, string>(
+  ARTICLE_CACHE_SIZE
+)
+
+// 文章缓存键：包含参与输出的全部字段，按固定顺序序列化。
+// 不能只用 url + 修改时间：frontmatter 修改标题、描述等字段时不一定会更新 dateModified，
+// 否则重新验证后仍会返回旧的 metadata / JSON-LD
+function getArticleCacheKey(data: BlogArticleData): string {
+  return JSON.stringify([
+    data.url,
+    data.title,
+    data.description,
+    data.image,
+    data.author,
+    data.datePublished,
+    data.dateModified,
+    data.keywords,
+    data.category,
+    data.wordCount,
+  ])
+}
+
 // 生成基础 SEO metadata
 export function generateSEOMetadata(config: SEOConfig = {}): Metadata {
-  const defaults = seoConfig.defaults
+  const defaults = resolvedDefaults
 
-  const mergedConfig = {
-    ...defaults,
-    ...config,
-    openGraph: {
-      ...defaults.openGraph,
-      ...config.openGraph,
-    },
-    twitter: {
-      ...defaults.twitter,
-      ...config.twitter,
-    },
-  }
+  const title = config.title ?? defaults.title
+  const description = config.description ?? defaults.description
+  const author = config.author ?? defaults.author
+  const canonicalUrl = config.canonicalUrl ?? defaults.canonicalUrl
+  const openGraph = config.openGraph
+    ? { ...defaults.openGraph, ...config.openGraph }
+    : defaults.openGraph
+  const twitter = config.twitter
+    ? { ...defaults.twitter, ...config.twitter }
+    : defaults.twitter
 
   return {
-    title: mergedConfig.title,
-    description: mergedConfig.description,
-    keywords: mergedConfig.keywords,
-    authors: mergedConfig.author ? [{ name: mergedConfig.author }] : undefined,
+    title,
+    description,
+    keywords: config.keywords ?? defaults.keywords,
+    authors: author ? [{ name: author }] : undefined,
     alternates: {
-      canonical: mergedConfig.canonicalUrl,
+      canonical: canonicalUrl,
     },
     openGraph: {
-      type: mergedConfig.openGraph?.type as 'website' | 'article',
-      siteName: mergedConfig.openGraph?.siteName,
-      locale: mergedConfig.openGraph?.locale,
-      images: mergedConfig.openGraph?.images,
-      title: mergedConfig.title,
-      description: mergedConfig.description,
-      url: mergedConfig.canonicalUrl,
+      type: openGraph?.type as 'website' | 'article',
+      siteName: openGraph?.siteName,
+      locale: openGraph?.locale,
+      images: openGraph?.images,
+      title,
+      description,
+      url: canonicalUrl,
     },
     twitter: {
-      card: mergedConfig.twitter?.card as 'summary' | 'summary_large_image',
-      site: mergedConfig.twitter?.site,
-      creator: mergedConfig.twitter?.creator,
-      title: mergedConfig.title,
-      description: mergedConfig.description,
-      images: mergedConfig.openGraph?.images?.[0]?.url,
+      card: twitter?.card as 'summary' | 'summary_large_image',
+      site: twitter?.site,
+      creator: twitter?.creator,
+      title,
+      description,
+      images: openGraph?.images?.[0]?.url,
     },
   }
 }
@@ -89,27 +220,35 @@ export function generateSEOMetadata(config: SEOConfig = {}): Metadata {
 export function generateBlogSEOMetadata(
   articleData: BlogArticleData
 ): Metadata {
-  return generateSEOMetadata({
+  const cacheKey = getArticleCacheKey(articleData)
+  const cached = articleMetadataCache.get(cacheKey)
+  if (cached) {
+    return cached
+  }
+
+  const metadata = generateSEOMetadata({
     title: `${articleData.title} - ${seoConfig.blog.title}`,
     description: articleData.description,
     keywords: articleData.keywords || seoConfig.blog.keywords,
     author: articleData.author,
     canonicalUrl: articleData.url,
-    openGraph: {
-      ...seoConfig.blog.openGraph,
-      type: 'article',
-      images: articleData.image
-        ? [
+    openGraph: articleData.image
+      ? {
+          ...blogOpenGraph,
+          images: [
             {
               url: articleData.image,
               width: 1200,
               height: 630,
               alt: articleData.title,
             },
-          ]
-        : seoConfig.blog.openGraph.images,
-    },
+          ],
+        }
+      : blogOpenGraph,
   })
+
+  articleMetadataCache.set(cacheKey, metadata)
+  return metadata
 }
 
 // 生成结构化数据
@@ -117,33 +256,29 @@ export function generateStructuredData(
   type: 'website' | 'blog' | 'article',
   data?: BlogArticleData
 ): string {
-  const structuredData = seoConfig.blog.structuredData
-
   switch (type) {
     case 'website':
-      return JSON.stringify(structuredData.website, null, 2)
+      return structuredDataFragments.website
 
     case 'blog':
-      return JSON.stringify(
-        [
-          structuredData.website,
-          structuredData.organization,
-          structuredData.blog,
-        ],
-        null,
-        2
-      )
-
-    case 'article':
+      return blogStructuredDataJson
+
+    case 'article': {
       if (!data) {
         throw new Error('Article data is required for article structured data')
       }
 
+      const cacheKey = getArticleCacheKey(data)
+      const cached = articleStructuredDataCache.get(cacheKey)
+      if (cached) {
+        return cached
+      }
+
       const articleStructuredData = {
-        ...structuredData.article,
+        ...structuredDataTemplates.article,
         headline: data.title,
         description: data.description,
-        image: data.image || structuredData.organization.logo.url,
+        image: data.image || structuredDataTemplates.organization.logo.url,
         author: {
           '@type': 'Person',
           name: data.author,
@@ -159,19 +294,16 @@ export function generateStructuredData(
         wordCount: data.wordCount,
       }
 
-      return JSON.stringify(
-        [
-          structuredData.website,
-          structuredData.organization,
-          structuredData.blog,
-          articleStructuredData,
-        ],
-        null,
-        2
-      )
+      const json = spliceFragments([
+        ...structuredDataFragments.sharedNodes,
+        serializeFragment(articleStructuredData),
+      ])
+      articleStructuredDataCache.set(cacheKey, json)
+      return json
+    }
 
     default:
-      return JSON.stringify(structuredData.website, null, 2)
+      return structuredDataFragments.website
   }
 }
 
@@ -180,11 +312,17 @@ export function getSEOConfig() {
   return seoConfig
 }
 
-// 博客列表页面的 SEO
+let blogListMetadata: Metadata | undefined
+
+// 博客列表页面的 SEO（只依赖静态配置，生成一次后复用）
 export function generateBlogListSEOMetadata(): Metadata {
+  if (blogListMetadata) {
+    return blogListMetadata
+  }
+
   const blogConfig = seoConfig.blog
 
-  return generateSEOMetadata({
+  blogListMetadata = generateSEOMetadata({
     title: blogConfig.title,
     description: blogConfig.description,
     keywords: blogConfig.keywords,
@@ -192,4 +330,5 @@ export function generateBlogListSEOMetadata(): Metadata {
     openGraph: blogConfig.openGraph,
     twitter: blogConfig.twitter,
   })
+  return blogListMetadata
 }
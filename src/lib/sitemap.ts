@@ -1,82 +1,209 @@
 import { MetadataRoute } from 'next'
+import { getContentSource, type BlogPostSummary } from '@/lib/content'
 
 // 站点基础URL，从环境变量获取或使用默认值
 const baseUrl = process.env.NEXT_PUBLIC_SITE_URL || 'http://localhost:3000'
 
+// 单个子 sitemap 的最大 URL 数量（协议上限为 50,000 条 / 50MB）
+export const SITEMAP_SHARD_SIZE = 45000
+
+// sitemap 索引的数据缓存标签，文章增删时失效
+export const SITEMAP_INDEX_TAG = 'sitemap-index'
+
+type ChangeFrequency = NonNullable<
+  MetadataRoute.Sitemap[number]['changeFrequency']
+>
+
+export type SitemapEntry = MetadataRoute.Sitemap[number]
+
 // 静态页面配置
-const staticPages = [
+// lastModified 为页面内容最后一次实际修改的日期，修改页面内容时同步更新；
+// 不使用构建或进程启动时间，否则每次部署都会让所有静态页面显示为已修改
+const staticPages: Array<{
+  path: string
+  priority: number
+  changeFrequency: ChangeFrequency
+  lastModified: string
+}> = [
   {
     path: '/',
+    lastModified: '2026-10-18',
     priority: 1.0,
-    changeFrequency: 'daily' as const,
+    changeFrequency: 'daily',
   },
   {
     path: '/about',
+    lastModified: '2026-10-18',
     priority: 0.8,
-    changeFrequency: 'monthly' as const,
+    changeFrequency: 'monthly',
   },
   {
     path: '/contact',
+    lastModified: '2026-10-18',
     priority: 0.7,
-    changeFrequency: 'monthly' as const,
+    changeFrequency: 'monthly',
+  },
+  {
+    path: '/blog',
+    lastModified: '2026-10-18',
+    priority: 0.8,
+    changeFrequency: 'daily',
   },
   {
     path: '/isr-demo',
+    lastModified: '2026-10-18',
     priority: 0.6,
-    changeFrequency: 'weekly' as const,
+    changeFrequency: 'weekly',
   },
 ]
 
+// next.config.ts 开启了 trailingSlash，页面 URL 带斜杠，避免爬虫访问时再被 308 重定向
+function withTrailingSlash(path: string): string {
+  return path.endsWith('/') ? path : `${path}/`
+}
+
 // 生成静态页面的sitemap条目
 export function generateSitemapPages(): MetadataRoute.Sitemap {
   return staticPages.map(page => ({
-    url: `${baseUrl}${page.path}`,
-    lastModified: new Date(),
+    url: `${baseUrl}${withTrailingSlash(page.path)}`,
+    lastModified: new Date(page.lastModified),
     changeFrequency: page.changeFrequency,
     priority: page.priority,
   }))
 }
 
-// 生成博客文章的sitemap条目
-export async function generateBlogSitemapEntries(): Promise<MetadataRoute.Sitemap> {
-  // 这里可以从CMS、数据库或文件系统获取博客文章
-  // 目前返回示例数据，你可以根据实际需求修改
-
-  try {
-    // 示例：如果你有博客文章数据，可以在这里获取
-    // const posts = await getBlogPosts()
-
-    // 目前返回空数组，因为模板中没有博客功能
-    const blogPosts: Array<{
-      slug: string
-      lastModified: Date
-      priority?: number
-      changeFrequency?:
-        | 'always'
-        | 'hourly'
-        | 'daily'
-        | 'weekly'
-        | 'monthly'
-        | 'yearly'
-        | 'never'
-    }> = []
-
-    return blogPosts.map(post => ({
-      url: `${baseUrl}/blog/${post.slug}`,
-      lastModified: post.lastModified,
-      changeFrequency: post.changeFrequency || 'weekly',
-      priority: post.priority || 0.6,
-    }))
-  } catch (error) {
-    console.error('Error generating blog sitemap entries:', error)
-    return []
+function toBlogSitemapEntry(post: BlogPostSummary): SitemapEntry {
+  return {
+    url: `${baseUrl}/blog/${post.slug}/`,
+    lastModified: new Date(post.dateModified || post.datePublished),
+    changeFrequency: 'weekly',
+    priority: 0.6,
+  }
+}
+
+// 逐条生成博客文章的sitemap条目
+export async function* generateBlogSitemapEntries(
+  offset = 0,
+  limit = Number.POSITIVE_INFINITY
+): AsyncGenerator<SitemapEntry> {
+  for await (const post of getContentSource().iterate(offset, limit)) {
+    yield toBlogSitemapEntry(post)
+  }
+}
+
+// 子 sitemap 数量：第 0 片为静态页面，其余按 SITEMAP_SHARD_SIZE 切分博客文章
+//
+// 数据源出错时直接抛出，让路由返回 5xx 而不被缓存；
+// 返回兜底值会把只含静态页面的索引缓存一小时，期间所有文章分片都变成 404
+export async function getSitemapShardCount(): Promise<number> {
+  const postCount = await getContentSource().count()
+  return 1 + Math.ceil(postCount / SITEMAP_SHARD_SIZE)
+}
+
+// 获取指定子 sitemap 的条目流
+export async function* getSitemapShardEntries(
+  shard: number
+): AsyncGenerator<SitemapEntry> {
+  if (shard === 0) {
+    yield* generateSitemapPages()
+    return
+  }
+
+  yield* generateBlogSitemapEntries(
+    (shard - 1) * SITEMAP_SHARD_SIZE,
+    SITEMAP_SHARD_SIZE
+  )
+}
+
+// 博客文章（按数据源顺序的位置）所在的子 sitemap
+export function getSitemapShardForPosition(position: number): number {
+  return 1 + Math.floor(position / SITEMAP_SHARD_SIZE)
+}
+
+export function getSitemapShardUrl(shard: number): string {
+  return `${baseUrl}/sitemap/${shard}.xml`
+}
+
+function escapeXml(value: string): string {
+  return value
+    .replace(/&/g, '&amp;')
+    .replace(/</g, '&lt;')
+    .replace(/>/g, '&gt;')
+    .replace(/"/g, '&quot;')
+    .replace(/'/g, '&apos;')
+}
+
+function formatLastModified(value: SitemapEntry['lastModified']): string {
+  return value instanceof Date ? value.toISOString() : String(value)
+}
+
+function renderUrl(entry: SitemapEntry): string {
+  let xml = `<url><loc>${escapeXml(entry.url)}</loc>`
+  if (entry.lastModified) {
+    xml += `<lastmod>${formatLastModified(entry.lastModified)}</lastmod>`
+  }
+  if (entry.changeFrequency) {
+    xml += `<changefreq>${entry.changeFrequency}</changefreq>`
+  }
+  if (entry.priority !== undefined) {
+    xml += `<priority>${entry.priority}</priority>`
   }
+  return `${xml}</url>\n`
 }
 
-// 获取所有sitemap条目
-export async function getAllSitemapEntries(): Promise<MetadataRoute.Sitemap> {
-  const staticPages = generateSitemapPages()
-  const blogPages = await generateBlogSitemapEntries()
+const STREAM_BATCH_SIZE = 500
+
+// 把条目流编码为 XML 字节流，边生成边输出
+export function streamSitemapXml(
+  entries: AsyncIterable<SitemapEntry>
+): ReadableStream<Uint8Array> {
+  const encoder = new TextEncoder()
+  const iterator = entries[Symbol.asyncIterator]()
+  let started = false
+
+  return new ReadableStream<Uint8Array>({
+    async pull(controller) {
+      if (!started) {
+        started = true
+        controller.enqueue(
+          encoder.encode(
+            '<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+          )
+        )
+      }
 
-  return [...staticPages, ...blogPages]
+      try {
+        // 每次拉取合并一批条目，减少小块写入的开销
+        let chunk = ''
+        for (let i = 0; i < STREAM_BATCH_SIZE; i++) {
+          const { value, done } = await iterator.next()
+          if (done) {
+            controller.enqueue(encoder.encode(`${chunk}</urlset>\n`))
+            controller.close()
+            return
+          }
+          chunk += renderUrl(value)
+        }
+        controller.enqueue(encoder.encode(chunk))
+      } catch (error) {
+        console.error('Error streaming sitemap entries:', error)
+        controller.error(error)
+      }
+    },
+    async cancel() {
+      await iterator.return?.()
+    },
+  })
+}
+
+// 生成 sitemap 索引 XML
+export async function generateSitemapIndexXml(): Promise<string> {
+  const shardCount = await getSitemapShardCount()
+
+  let xml =
+    '<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+  for (let shard = 0; shard < shardCount; shard++) {
+    xml += `<sitemap><loc>${escapeXml(getSitemapShardUrl(shard))}</loc></sitemap>\n`
+  }
+  return `${xml}</sitemapindex>\n`
 }
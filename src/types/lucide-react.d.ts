@@ -0,0 +1,8 @@
+// lucide-react 的单图标模块（lucide-react/icons/<name>）没有独立的类型声明，
+// 这里声明为默认导出的 LucideIcon，与桶文件中的具名导出类型一致
+declare module 'lucide-react/icons/*' {
+  import type { LucideIcon } from 'lucide-react'
+
+  const icon: LucideIcon
+  export default icon
+}